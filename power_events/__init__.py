@@ -1,13 +1,61 @@
-"""Top-level Power event package."""
+"""Top-level Power event package.
 
-from importlib.metadata import PackageNotFoundError, version
+Its attributes are imported on first access: importing the package alone stays cheap.
+"""
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:  # pragma: no cover
-    # package is not installed
-    __version__ = "undefined"
+from importlib import import_module
 
-from .event import event_converter as event_converter
-from .resolver import EventResolver as EventResolver
-from .resolver import EventRouter as EventRouter
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .event import event_converter as event_converter
+    from .resolver import EventResolver as EventResolver
+    from .resolver import EventRouter as EventRouter
+
+    __version__: str
+
+__all__ = ["EventResolver", "EventRouter", "__version__", "event_converter"]
+
+_LAZY_ATTRIBUTES = {
+    "event_converter": ".event",
+    "EventResolver": ".resolver",
+    "EventRouter": ".resolver",
+}
+"""Module of each attribute imported on first access."""
+
+
+def __getattr__(name: str) -> object:
+    value: object
+    if name == "__version__":
+        value = _version()
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        value = _import_submodule(name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        return version(__name__)
+    except PackageNotFoundError:  # pragma: no cover
+        # package is not installed
+        return "undefined"
+
+
+def _import_submodule(name: str) -> object:
+    """Import the submodule of the name, as the attribute of an eagerly imported package."""
+    if name.isidentifier() and not name.startswith("__"):
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
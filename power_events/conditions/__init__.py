@@ -1,10 +1,17 @@
 """Top-level conditions package.
 
 This package contains all the logic about the condition.
+Its attributes are imported on first access, as for the top-level package.
 """
 
-from power_events.conditions.condition import And, Condition, Neg, Or
-from power_events.conditions.value import Value, ValuePath
+from importlib import import_module
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from power_events.conditions.compiler import compile_condition
+    from power_events.conditions.condition import And, Condition, Neg, Or
+    from power_events.conditions.normalize import normalize
+    from power_events.conditions.value import Value, ValuePath
 
 __all__ = [
     "And",
@@ -13,4 +20,42 @@ __all__ = [
     "Or",
     "Value",
     "ValuePath",
+    "compile_condition",
+    "normalize",
 ]
+
+_LAZY_ATTRIBUTES = {
+    "compile_condition": ".compiler",
+    "And": ".condition",
+    "Condition": ".condition",
+    "Neg": ".condition",
+    "Or": ".condition",
+    "normalize": ".normalize",
+    "Value": ".value",
+    "ValuePath": ".value",
+}
+"""Module of each attribute imported on first access."""
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        value = _import_submodule(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def _import_submodule(name: str) -> object:
+    """Import the submodule of the name, as the attribute of an eagerly imported package."""
+    if name.isidentifier() and not name.startswith("__"):
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,145 @@
+"""Adaptive ordering of the sub-conditions of `And`/`Or` expressions.
+
+Expressions short-circuit: `And` stops on the first failing sub-condition, `Or` on the first
+passing one. How early depends on the order they were written. An `AdaptiveCheck` samples
+the cost and the pass rate of each sub-condition, while checking events, and periodically
+reorders them: the cheapest and most selective first.
+
+Sub-conditions being pure boolean checks, the order has no effect on the results.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any
+
+from power_events.conditions.compiler import _event_for, _is_operator, compile_condition
+from power_events.conditions.condition import And, Condition
+
+# Floor of the probabilities, so that a never short-circuiting sub-condition still gets a rank.
+_MIN_PROBABILITY = 1e-3
+
+
+@dataclass(slots=True)
+class _Stats:
+    """Statistics of a condition, over the sampled checks."""
+
+    checks: int = 0
+    passes: int = 0
+    time_ns: int = 0
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes / self.checks if self.checks else 0.5
+
+
+class AdaptiveCheck:
+    """Check of a condition, reordering its sub-conditions from statistics sampled on events.
+
+    One check out of `sample_every` is sampled: all the sub-conditions are evaluated, to
+    measure their cost and pass rate. Every `reorder_every` samples, the sub-conditions of
+    each expression are reordered then the condition is compiled again.
+
+    If evaluating all the sub-conditions raises an error, the order is frozen, as the
+    written order may be what prevents it.
+
+    Checks may run from several threads: one samples at a time, the others skip sampling,
+    and the reordered check is swapped in at once.
+    """
+
+    def __init__(
+        self, condition: Condition, *, sample_every: int = 100, reorder_every: int = 10
+    ) -> None:
+        """Initialize the adaptive check of the condition.
+
+        Args:
+            condition: The condition to check.
+            sample_every: The number of checks between two sampled ones.
+            reorder_every: The number of samples between two reorderings.
+        """
+        self.condition = condition
+        self._check = compile_condition(condition)
+        self._sample_every = sample_every
+        self._reorder_every = reorder_every
+        self._checks = 0
+        self._samples = 0
+        self._frozen = False
+        self._stats: dict[Condition, _Stats] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: Mapping[Any, Any]) -> bool:
+        """Check the condition against the event.
+
+        Args:
+            event: The event to check.
+        """
+        self._checks += 1
+        if self._frozen or self._checks % self._sample_every or not self._lock.acquire(False):
+            return self._check(event)
+
+        try:
+            return self._sample(event)
+        finally:
+            self._lock.release()
+
+    def _sample(self, event: Mapping[Any, Any]) -> bool:
+        """Check the event evaluating all the sub-conditions, then reorder them if it is time.
+
+        Must be called holding the lock.
+        """
+        try:
+            result = self._evaluate(self.condition, event)
+            self._samples += 1
+            if self._samples % self._reorder_every == 0:
+                condition = self._reorder(self.condition)[0]
+                self._check = compile_condition(condition)
+                self.condition = condition
+        except Exception:
+            self._frozen = True
+            return self._check(event)
+        return result
+
+    def _evaluate(self, condition: Condition, event: Mapping[Any, Any]) -> bool:
+        """Evaluate all the sub-conditions of the condition, recording their statistics."""
+        stats = self._stats.setdefault(condition, _Stats())
+
+        if _is_operator(condition):
+            results = [self._evaluate(sub, event) for sub in condition.conditions]
+            result = all(results) if type(condition) is And else any(results)
+        else:
+            start = perf_counter_ns()
+            result = bool(condition.check(_event_for(condition, event)))
+            stats.time_ns += perf_counter_ns() - start
+
+        stats.checks += 1
+        stats.passes += result
+        return result
+
+    def _reorder(self, condition: Condition) -> tuple[Condition, float]:
+        """Reorder the sub-conditions, bottom-up.
+
+        Returns:
+            The reordered condition, with its expected cost per check.
+        """
+        stats = self._stats.setdefault(condition, _Stats())
+        if not _is_operator(condition):
+            return condition, stats.time_ns / stats.checks if stats.checks else 0.0
+
+        is_and = type(condition) is And
+        ranked: list[tuple[float, Condition, float, float]] = []
+        for sub in condition.conditions:
+            reordered, cost = self._reorder(sub)
+            pass_rate = self._stats[reordered].pass_rate
+            short_circuit = (1 - pass_rate) if is_and else pass_rate
+            ranked.append((cost / max(short_circuit, _MIN_PROBABILITY), reordered, cost, pass_rate))
+        ranked.sort(key=lambda rank: rank[0])
+
+        expected_cost, reached = 0.0, 1.0
+        for _, _, cost, pass_rate in ranked:
+            expected_cost += reached * cost
+            reached *= pass_rate if is_and else 1 - pass_rate
+
+        reordered_condition = type(condition)(*(sub for _, sub, _, _ in ranked))
+        self._stats[reordered_condition] = self._stats.pop(condition)
+        return reordered_condition, expected_cost
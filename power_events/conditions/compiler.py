@@ -0,0 +1,237 @@
+"""Compilation of condition trees into flat Python functions.
+
+Checking a condition tree walks each node: method calls, operator dispatch, generators and
+predicate combinations. Compiling it generates a single function, where value paths are read
+inline and sub-conditions are joined by native short-circuiting `and`/`or`.
+
+Conditions of the same shape generate the same source, whose code is compiled once and kept
+in a `CodeCache`. The cache can be saved to a file, for other processes to skip compiling.
+"""
+
+import marshal
+import os
+import stat
+from collections.abc import Callable, Mapping
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from threading import Lock
+from types import CodeType
+from typing import Any, TypeGuard, Union
+
+from power_events.conditions.condition import And, Condition, ConditionExpression, Or
+from power_events.conditions.value import _NOT_FOUND, CachedEvent, Value
+
+CompiledCondition = Callable[[Mapping[Any, Any]], bool]
+StrPath = Union[str, "os.PathLike[str]"]
+
+
+class CodeCache:
+    """Code of the generated check functions, by source.
+
+    Saved files hold Python bytecode: they must be trusted, as `__pycache__` files are.
+    Files not owned by the current user, or writable by others, are never loaded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._codes: dict[str, CodeType] = {}
+        self._lock = Lock()
+        self.modified = False
+        """Whether codes were compiled since the last load or save."""
+
+    def get(self, source: str, filename: str) -> CodeType:
+        """Get the code of the source, compiling it if not cached.
+
+        Args:
+            source: The source of the function definition.
+            filename: The name of the code, in tracebacks.
+        """
+        try:
+            return self._codes[source]
+        except KeyError:
+            pass
+
+        code = compile(source, filename, "exec")
+        with self._lock:
+            self.modified = True
+            return self._codes.setdefault(source, code)
+
+    def load(self, path: StrPath) -> bool:
+        """Add the codes saved in the file to the cache.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            Whether the file was loaded, it is ignored when missing, invalid, saved by
+            another Python version, or when it may have been written by another user.
+        """
+        try:
+            with Path(path).open("rb") as file:
+                if not _is_private(os.fstat(file.fileno())):
+                    return False
+                data = file.read()
+        except OSError:
+            return False
+
+        if not data.startswith(MAGIC_NUMBER):
+            return False
+        try:
+            codes = marshal.loads(data[len(MAGIC_NUMBER) :])  # noqa: S302
+        except (EOFError, ValueError, TypeError):
+            return False
+        if not isinstance(codes, dict):
+            return False
+
+        with self._lock:
+            for source, code in codes.items():
+                if isinstance(source, str) and isinstance(code, CodeType):
+                    self._codes.setdefault(source, code)
+            self.modified = False
+        return True
+
+    def save(self, path: StrPath) -> None:
+        """Save the cached codes to the file, replacing it at once.
+
+        Args:
+            path: The path of the file.
+        """
+        path = Path(path)
+        with self._lock:
+            data = MAGIC_NUMBER + marshal.dumps(self._codes)
+            self.modified = False
+
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.unlink(missing_ok=True)
+        # Only writable by the current user, for the file to be loaded again.
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o600)
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+
+code_cache = CodeCache()
+"""Cache of the codes of all the compiled conditions."""
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _is_private(status: os.stat_result) -> bool:
+    """Whether the file is owned by the current user, and not writable by the others."""
+    if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return False
+    # No owner to compare to on Windows.
+    return not hasattr(os, "getuid") or status.st_uid == os.getuid()
+
+
+def compile_condition(condition: Condition) -> CompiledCondition:
+    """Compile the condition tree into a single function checking an event.
+
+    The compiled function behaves like `condition.check`, for the condition as it is at
+    compilation time. Values with a mapper and custom conditions are called as is, the
+    latter with the original event rather than its `CachedEvent` view.
+
+    Args:
+        condition: The condition to compile.
+    """
+    compiler = _Compiler()
+    expression = compiler.expression(condition)
+    source = (
+        "def check(event):\n"
+        "    extract = event.extract if type(event) is CachedEvent else None\n"
+        f"    return bool({expression})\n"
+    )
+
+    try:
+        code = code_cache.get(source, f"<condition {type(condition).__name__}>")
+    except (SyntaxError, RecursionError, MemoryError):  # pragma: no cover
+        # Too deeply nested to be generated.
+        return lambda event: condition.check(_event_for(condition, event))
+
+    namespace = {**compiler.namespace, "CachedEvent": CachedEvent, "NOT_FOUND": _NOT_FOUND}
+    exec(code, namespace)  # noqa: S102
+    check: CompiledCondition = namespace["check"]
+    return check
+
+
+class _Compiler:
+    """Generator of the expression of a condition tree, and of the namespace it needs."""
+
+    def __init__(self) -> None:
+        self.namespace: dict[str, Any] = {}
+
+    def expression(self, condition: Condition) -> str:
+        """Generate the expression checking the condition against `event`.
+
+        Args:
+            condition: The condition to generate.
+        """
+        if _is_operator(condition):
+            return self._expression_of_operator(condition)
+
+        # Exact values only, a subclass may check on its own.
+        if type(condition) is Value and condition.predicates and not condition.has_mapper:
+            return self._expression_of_value(condition)
+
+        if type(condition) is Value:
+            return f"{self._bind(condition.check)}(event)"
+        return f"{self._bind(condition.check)}(event.event if extract else event)"
+
+    def _expression_of_operator(self, condition: And | Or) -> str:
+        operator_type = type(condition)
+        keyword = " and " if operator_type is And else " or "
+        parts = [self.expression(sub) for sub in _flatten(condition, operator_type)]
+
+        if not parts:
+            return "True" if operator_type is And else "False"
+        return f"({keyword.join(parts)})"
+
+    def _expression_of_value(self, value: Value) -> str:
+        path = self._bind(value.path)
+        accessor = self._bind(value.path._accessor)
+        get = f"(extract({path}) if extract else {accessor}(event))"
+        checks = " and ".join(f"{self._bind(predicate)}(val)" for predicate in value.predicates)
+        return f"((val := {get}) is not NOT_FOUND and {checks})"
+
+    def _bind(self, obj: Any) -> str:
+        """Add the object to the namespace, returning its name."""
+        name = f"_{len(self.namespace)}"
+        self.namespace[name] = obj
+        return name
+
+
+def _is_operator(condition: Condition) -> TypeGuard[And | Or]:
+    """Whether the condition is exactly an `And` or an `Or`, not a subclass with its own logic."""
+    return type(condition) is And or type(condition) is Or
+
+
+def _event_for(condition: Condition, event: Mapping[Any, Any]) -> Mapping[Any, Any]:
+    """Get the event to check the condition against.
+
+    Exact values read their paths through the `CachedEvent` view, other conditions get the
+    original event: they may rely on its type.
+    """
+    if type(event) is CachedEvent and type(condition) is not Value:
+        return event.event
+    return event
+
+
+def _flatten(
+    condition: ConditionExpression, operator_type: type[ConditionExpression]
+) -> list[Condition]:
+    """Get the sub-conditions of an expression, merging the nested ones of same operator.
+
+    Args:
+        condition: The expression to flatten.
+        operator_type: The type of expression to merge.
+    """
+    flat: list[Condition] = []
+    for sub in condition.conditions:
+        if type(sub) is operator_type:
+            flat.extend(_flatten(sub, operator_type))
+        else:
+            flat.append(sub)
+    return flat
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from enum import Enum
 from typing import (
     Any,
@@ -75,6 +75,11 @@ class ConditionExpression(Condition, ABC):
         """
         self._conditions = conditions
 
+    @property
+    def conditions(self) -> tuple[Condition, ...]:
+        """The conditions that make up the expression."""
+        return self._conditions
+
     @override
     def check(self, event: Event[V]) -> bool:
         return self.operator(condition.check(event) for condition in self._conditions)
@@ -119,3 +124,16 @@ def Neg(condition: Condition) -> Condition:  # noqa: N802
         condition: The condition to invert.
     """
     return ~condition
+
+
+def leaves(condition: Condition) -> Iterator[Condition]:
+    """Iterate over the conditions which are not expressions, inside the condition tree.
+
+    Args:
+        condition: The root of the condition tree.
+    """
+    if isinstance(condition, ConditionExpression):
+        for sub_condition in condition.conditions:
+            yield from leaves(sub_condition)
+    else:
+        yield condition
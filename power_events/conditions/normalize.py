@@ -0,0 +1,155 @@
+"""Algebraic normalization of condition trees.
+
+Combining conditions with `&`, `|` or `include_router` builds deeply nested binary trees,
+often with repeated checks. Normalizing a tree gives an equivalent one, cheaper to check:
+
+- nested expressions of same operator are flattened: `And(And(a, b), c)` is `And(a, b, c)`;
+- duplicate sub-conditions are removed, only keeping the first one;
+- constant sub-conditions are simplified, `And()` being always true and `Or()` always false;
+- checks of a value against expected values on the same path are merged:
+  `Or(Value(p).equals(1), Value(p).equals(2))` is `Value(p).one_of((1, 2))`.
+
+Conditions are assumed pure, checking twice the same one gives the same result.
+"""
+
+from collections.abc import Hashable
+from typing import Any, TypeGuard
+
+from power_events.conditions.condition import And, Condition, Or
+from power_events.conditions.value import Value, ValuePath
+
+
+def normalize(condition: Condition) -> Condition:
+    """Get the normalized equivalent of the condition.
+
+    The given condition is left untouched, sub-conditions are reused when possible.
+
+    Args:
+        condition: The condition to normalize.
+    """
+    if _is_operator(condition):
+        return _normalize_expression(condition)
+    return condition
+
+
+def _is_operator(condition: Condition) -> TypeGuard[And | Or]:
+    """Whether the condition is exactly an `And` or an `Or`, not a subclass with its own logic."""
+    return type(condition) is And or type(condition) is Or
+
+
+def _normalize_expression(expression: And | Or) -> Condition:
+    operator_type = type(expression)
+    # A false `Or()` absorbs an `And`, a true `And()` absorbs an `Or`.
+    absorbing_type: type[And | Or] = Or if operator_type is And else And
+
+    conditions: list[Condition] = []
+    for sub_condition in map(normalize, expression.conditions):
+        if _is_operator(sub_condition) and type(sub_condition) is operator_type:
+            conditions.extend(sub_condition.conditions)
+        elif _is_operator(sub_condition) and not sub_condition.conditions:
+            # Constant of the other operator, absorbing the expression.
+            return absorbing_type()
+        else:
+            conditions.append(sub_condition)
+
+    merged = _merge_expected_values(conditions, union=operator_type is Or)
+    if merged is None:
+        return absorbing_type()
+
+    unique: dict[Hashable, Condition] = {}
+    for condition in merged:
+        unique.setdefault(_key(condition), condition)
+
+    if len(unique) == 1:
+        return next(iter(unique.values()))
+    return operator_type(*unique.values())
+
+
+def _merge_expected_values(conditions: list[Condition], *, union: bool) -> list[Condition] | None:
+    """Merge the values only checked against expected values, on a same path.
+
+    Args:
+        conditions: The sub-conditions of the expression.
+        union: whether the expected values are merged by union (`Or`), or by intersection (`And`).
+
+    Returns:
+        The merged sub-conditions, `None` when an intersection is empty, so never true.
+    """
+    by_path: dict[ValuePath, list[Value]] = {}
+    for condition in conditions:
+        if _is_expected_values_check(condition):
+            by_path.setdefault(condition.path, []).append(condition)
+
+    merged: list[Condition] = []
+    for condition in conditions:
+        if not _is_expected_values_check(condition):
+            merged.append(condition)
+            continue
+
+        values = by_path[condition.path]
+        if len(values) == 1:
+            merged.append(condition)
+        elif values[0] is condition:
+            expected = _merge(values, union=union)
+            if not expected:
+                return None
+            merged.append(_expected_values_check(condition.path, expected))
+
+    return merged
+
+
+def _is_expected_values_check(condition: Condition) -> TypeGuard[Value]:
+    """Whether the condition is only the check of its value against expected values.
+
+    Subclasses are never merged, they may check on their own.
+    """
+    return (
+        type(condition) is Value
+        and condition.expected_values is not None
+        and len(condition.predicates) == 1
+    )
+
+
+def _merge(values: list[Value], *, union: bool) -> list[Any]:
+    """Merge the expected values, keeping their order of appearance."""
+    expected = [value.expected_values or frozenset() for value in values]
+    kept = frozenset().union(*expected) if union else frozenset.intersection(*expected)
+    return [
+        val for val in dict.fromkeys(val for values in expected for val in values) if val in kept
+    ]
+
+
+def _expected_values_check(path: ValuePath, expected: list[Any]) -> Value:
+    """Build the value check against the expected values."""
+    if len(expected) == 1:
+        return Value(path).equals(expected[0])
+    return Value(path).one_of(tuple(expected))
+
+
+def _key(condition: Condition) -> Hashable:
+    """Get the structural key of a condition, equal for equivalent conditions.
+
+    Args:
+        condition: The condition to identify.
+    """
+    if _is_operator(condition):
+        return type(condition), tuple(_key(sub) for sub in condition.conditions)
+
+    if type(condition) is Value and not condition.has_mapper:
+        return Value, condition.path, tuple(_predicate_key(p) for p in condition.predicates)
+
+    return condition
+
+
+def _predicate_key(predicate: object) -> Hashable:
+    """Get the key of a predicate, from its type and attributes when hashable, else itself."""
+    attributes = getattr(predicate, "__dict__", None)
+    if not attributes:
+        return predicate
+
+    key = (type(predicate), tuple(sorted(attributes.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return predicate
+    return key
@@ -1,10 +1,10 @@
 import re
-from collections.abc import Container, Mapping
-from typing import Any, overload
+from collections.abc import Container, Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import Any, Callable, overload
 
 from maypy import Mapper, Predicate, maybe
 from maypy.predicates import (
-    contains,
     equals,
     is_blank_str,
     is_empty,
@@ -34,6 +34,8 @@ class ValuePath(str):
     SEPARATOR = "."
     separator: str
     keys: list[str]
+    _steps: tuple["_Step", ...]
+    _accessor: Callable[[Any], Any]
 
     def __new__(cls, path: str, *, separator: str | None = None) -> Self:
         """Create a new ValuePath object from a path string.
@@ -43,17 +45,31 @@ class ValuePath(str):
             separator: custom separator to use instead of the default.
         """
         separator = separator or cls.SEPARATOR
-        is_blank = is_blank_str(path)
-
-        if not is_blank:
-            cls._validation(path, separator)
+        parsed = cls._parse(path, separator)
 
         instance = super().__new__(cls, path)
         instance.separator = separator
-        instance.keys = [] if is_blank else instance.strip().split(separator)
+        instance.keys = list(parsed[0])
+        instance._steps, instance._accessor = parsed[1:]
 
         return instance
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse(cls, path: str, separator: str) -> "_ParsedPath":
+        """Validate the path, then build its keys, steps and accessor.
+
+        The last parsings are kept, many conditions use the same paths.
+        """
+        is_blank = is_blank_str(path)
+
+        if not is_blank:
+            cls._validation(path, separator)
+
+        keys = () if is_blank else tuple(path.strip().split(separator))
+        steps = tuple((key, _as_int_key(key)) for key in keys)
+        return keys, steps, _compile_accessor(steps)
+
     def get_from(
         self,
         mapping: Mapping[Any, V],
@@ -76,23 +92,16 @@ class ValuePath(str):
         Raises:
             ValueAbsentError: if parameter `raise_if_absent` set, and key is missing.
         """
-        value: Mapping[Any, V] | V | None | Absent = dict(mapping)
-        for key in self.keys:
-            key_present = False
-
-            if isinstance(value, Mapping):
-                if key in value:
-                    value = value[key]
-                    key_present = True
-
-                elif key.isdigit() and (num_key := int(key)) in value:
-                    value = value[num_key]
-                    key_present = True
-
-            if not key_present:
-                if raise_if_absent:
-                    raise ValueAbsentError(self, key, mapping)
-                return default
+        if type(mapping) is CachedEvent:
+            value = mapping.extract(self)
+            mapping = mapping.event
+        else:
+            value = self._accessor(mapping)
+
+        if value is _NOT_FOUND:
+            if raise_if_absent:
+                raise ValueAbsentError(self, self._missing_key(mapping), mapping)
+            return default
         return value
 
     @deprecated("""
@@ -124,6 +133,21 @@ class ValuePath(str):
         """
         return self.get_from(mapping, default, raise_if_absent=raise_if_absent)  # pragma: no cover
 
+    def _missing_key(self, mapping: Mapping[Any, Any]) -> str:
+        """Find the first key of the path missing in mapping object."""
+        value: Any = mapping
+        for step in self._steps:
+            if (value := _get_step(value, step)) is _NOT_FOUND:
+                return step[0]
+        raise ValueError(f"No key of path <{self}> is missing")  # pragma: no cover
+
+    def __getnewargs_ex__(self) -> tuple[tuple[str], dict[str, str]]:
+        return (str(self),), {"separator": self.separator}
+
+    def __getstate__(self) -> None:
+        # Everything is rebuilt from the new args, accessor included.
+        return None
+
     @staticmethod
     def _validation(path: str, sep: str) -> None:
         """Validate string path."""
@@ -139,6 +163,111 @@ class ValuePath(str):
             )
 
 
+class CachedEvent(Mapping[Any, V]):
+    """Read-only view over an event, extracting each shared path value only once.
+
+    Meant to be built for each resolved event, so all conditions reading the same path
+    share a single extraction. Other paths are read straight from the event.
+    """
+
+    __slots__ = ("_shared_paths", "_values", "event")
+
+    def __init__(self, event: Mapping[Any, V], shared_paths: Container[str]) -> None:
+        """Wrap the event.
+
+        Args:
+            event: The event to read values from.
+            shared_paths: The paths worth to be cached, read by several conditions.
+        """
+        self.event = event
+        self._shared_paths = shared_paths
+        self._values: dict[str, Any] = {}
+
+    def extract(self, path: ValuePath) -> Any:
+        """Get the value at path in the event, or `_NOT_FOUND` sentinel.
+
+        Args:
+            path: The path of the value.
+        """
+        if path not in self._shared_paths:
+            return path._accessor(self.event)
+
+        try:
+            return self._values[path]
+        except KeyError:
+            value = self._values[path] = path._accessor(self.event)
+            return value
+
+    def __getitem__(self, key: Any) -> V:
+        return self.event[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.event)
+
+    def __len__(self) -> int:
+        return len(self.event)
+
+    def __repr__(self) -> str:
+        return repr(self.event)
+
+
+_NOT_FOUND: Any = object()
+_Step = tuple[str, int | None]
+_ParsedPath = tuple[tuple[str, ...], tuple[_Step, ...], Callable[[Any], Any]]
+
+
+def _as_int_key(key: str) -> int | None:
+    """Get the integer alternative of a path key, if it has one."""
+    if not key.isdigit():
+        return None
+    try:
+        return int(key)
+    except ValueError:  # digits without decimal value, such as '²'
+        return None
+
+
+def _get_step(value: Any, step: _Step) -> Any:
+    """Get the value of a path key inside value, or `_NOT_FOUND` sentinel.
+
+    Args:
+        value: The mapping to lookup, any other type has no keys.
+        step: The key and its integer alternative.
+    """
+    if type(value) is not dict and not isinstance(value, Mapping):
+        return _NOT_FOUND
+
+    key, num_key = step
+    found = value.get(key, _NOT_FOUND)
+    if found is _NOT_FOUND and num_key is not None:
+        return value.get(num_key, _NOT_FOUND)
+    return found
+
+
+def _compile_accessor(steps: tuple[_Step, ...]) -> Callable[[Any], Any]:
+    """Build the function getting the value at path steps, or `_NOT_FOUND` sentinel.
+
+    Shallow paths, the most common ones, get an unrolled accessor.
+
+    Args:
+        steps: The path keys with their integer alternative.
+    """
+    if not steps:
+        return lambda mapping: mapping
+
+    if len(steps) == 1:
+        (step,) = steps
+        return lambda mapping: _get_step(mapping, step)
+
+    def access(mapping: Any) -> Any:
+        value = mapping
+        for step in steps:
+            if (value := _get_step(value, step)) is _NOT_FOUND:
+                break
+        return value
+
+    return access
+
+
 class _MissingPredicate:
     """A predicate that always returns False, representing a missing condition."""
 
@@ -152,6 +281,90 @@ class _MissingPredicate:
 MISSING = _MissingPredicate()
 
 
+def _hashed(values: Iterable[Any]) -> frozenset[Any] | None:
+    """Get the values as a frozenset, if all hashable."""
+    try:
+        return frozenset(values)
+    except TypeError:
+        return None
+
+
+class _OneOfHashed:
+    """Predicate passing when the value is one of the hashable options."""
+
+    def __init__(self, options: frozenset[Any]) -> None:
+        self.options = options
+
+    def __call__(self, val: Any) -> bool:
+        try:
+            return val in self.options
+        except TypeError:  # unhashable value, still compared as a list would
+            return any(option == val for option in self.options)
+
+    def __repr__(self) -> str:
+        return f"<one_of predicate with options {self.options}>"
+
+
+# Minimal length of a list, and number of items, from which searching them is faster through a
+# set: building it costs several linear searches, which may also stop early.
+_MIN_HASHED_SEARCH_LENGTH = 32
+_MIN_HASHED_SEARCH_ITEMS = 8
+
+
+class _Contains:
+    """Predicate passing when the value contains all the items.
+
+    Many hashable items are searched in a large list or tuple through a set of its elements,
+    if all hashable, in linear time instead of quadratic.
+    """
+
+    def __init__(self, *items: Any) -> None:
+        self.items = items
+        self._hashed_search = len(items) >= _MIN_HASHED_SEARCH_ITEMS and _hashed(items) is not None
+
+    def __call__(self, val: Any) -> bool:
+        if (
+            self._hashed_search
+            and type(val) in (list, tuple)
+            and len(val) >= _MIN_HASHED_SEARCH_LENGTH
+        ):
+            val = _hashed(val) or val
+        return all(item in val for item in self.items)
+
+    def __repr__(self) -> str:
+        return f"<contains predicate with items: {self.items}>"
+
+
+# Predicates whose result only depends on the checked value.
+# Options of `one_of` may be a mutable container, only the frozen ones are pure.
+_PURE_PREDICATES: tuple[Predicate[Any], ...] = (is_truthy, is_falsy, is_empty, is_blank_str)
+_PURE_PREDICATE_TYPES: set[type[Any]] = {
+    type(match_regex("")),
+    type(is_length(0)),
+    _OneOfHashed,
+    _Contains,
+}
+_NEG_TYPE = type(neg(is_truthy))
+_EQUALS_TYPE = type(equals(None))
+
+
+def _is_pure(predicate: Predicate[Any]) -> bool:
+    """Whether the predicate is known to only depend on the checked value."""
+    if type(predicate) is _NEG_TYPE:
+        return _is_pure(predicate.predicate)  # type: ignore[attr-defined]
+    if type(predicate) is _EQUALS_TYPE:
+        # A mutable expected value may change.
+        return _hashed((predicate.expected,)) is not None  # type: ignore[attr-defined]
+    return type(predicate) in _PURE_PREDICATE_TYPES or any(
+        predicate is pure for pure in _PURE_PREDICATES
+    )
+
+
+def _identity(val: Any) -> Any:
+    """Default mapper, returning the value unchanged."""
+    return val
+
+
 class Value(Condition):
     """Condition based on a value at a certain path in an event."""
 
@@ -164,7 +377,8 @@ class Value(Condition):
         """
         self.path: ValuePath = ValuePath(value_path)
         self._predicate: Predicate[Any] = MISSING
-        self.mapper: Mapper[Any, Any] = mapper or (lambda val: val)
+        self._expected_values: frozenset[Any] | None = None
+        self.mapper: Mapper[Any, Any] = mapper or _identity
 
     @classmethod
     def root(cls) -> Self:
@@ -212,6 +426,7 @@ class Value(Condition):
         Args:
             expected: The expected value.
         """
+        self.__restrict_to((expected,))
         return self.__add(equals(expected))
 
     @overload
@@ -235,9 +450,15 @@ class Value(Condition):
     def one_of(self, options: Container[Any]) -> Self:
         """Add value is one of the given options check to the condition.
 
+        Collections of hashable options are turned into a frozenset, for a constant time check.
+
         Args:
             options: The container of options.
         """
+        if isinstance(options, (set, frozenset, list, tuple)):
+            self.__restrict_to(options)
+            if (hashed := _hashed(options)) is not None:
+                return self.__add(_OneOfHashed(hashed))
         return self.__add(one_of(options))
 
     def contains(self, *items: Any) -> Self:
@@ -245,8 +466,13 @@ class Value(Condition):
 
         Args:
             items: The items to check for.
+
+        Raises:
+            ValueError: if no item has been passed.
         """
-        return self.__add(contains(*items))
+        if not items:
+            raise ValueError("At least one item is required")
+        return self.__add(_Contains(*items))
 
     def is_not_empty(self) -> Self:
         """Add value is not empty to the condition."""
@@ -268,6 +494,38 @@ class Value(Condition):
         """
         return self.__add(predicate)
 
+    @property
+    def has_mapper(self) -> bool:
+        """Whether the value is transformed by a mapper before checking it."""
+        return self.mapper is not _identity
+
+    @property
+    def is_pure(self) -> bool:
+        """Whether checking the value is known to only depend on the value at path.
+
+        It is the case for built-in predicates without mapper, not for custom ones.
+        """
+        predicates = self.predicates
+        return bool(predicates) and not self.has_mapper and all(map(_is_pure, predicates))
+
+    @property
+    def predicates(self) -> tuple[Predicate[Any], ...]:
+        """The predicates the value must all satisfy, in order of addition."""
+        if self._predicate is MISSING:
+            return ()
+        return _flatten(self._predicate)
+
+    @property
+    def expected_values(self) -> frozenset[Any] | None:
+        """The finite set of values the one at path must belong to, for the check to pass.
+
+        Known from `equals` and `one_of` predicates, it is `None` when the value is not bound
+        to a finite set of hashable values, or when a mapper transforms it before checking.
+        """
+        if self.has_mapper:
+            return None
+        return self._expected_values
+
     @override
     def __or__(self, other: Condition) -> Condition:
         if not isinstance(other, Condition):
@@ -299,18 +557,52 @@ class Value(Condition):
 
         return self
 
+    def __restrict_to(self, values: Iterable[Any]) -> None:
+        """Narrow the expected values to the given ones, when all hashable.
+
+        Args:
+            values: The values the one at path is bound to.
+        """
+        if (expected := _hashed(values)) is None:
+            return
+
+        if self._expected_values is None:
+            self._expected_values = expected
+        else:
+            self._expected_values &= expected
+
     def __repr__(self) -> str:
         return f"Value(path={self.path}, predicate={self._predicate})"
 
 
+class _AllOf:
+    """Predicate passing when all its predicates pass."""
+
+    def __init__(self, *predicates: Predicate[Any]) -> None:
+        self.predicates = predicates
+
+    def __call__(self, val: Any) -> bool:
+        return all(predicate(val) for predicate in self.predicates)
+
+    def __repr__(self) -> str:
+        return f"<all of predicates {self.predicates}>"
+
+
 def combine(*predicates: Predicate[Any]) -> Predicate[Any]:
     """Combine all provided predicates into a single predicate.
 
     Args:
         predicates: Predicates to combine.
     """
+    return _AllOf(*predicates)
 
-    def test(val: Any) -> bool:
-        return all(predicate(val) for predicate in predicates)
 
-    return test
+def _flatten(predicate: Predicate[Any]) -> tuple[Predicate[Any], ...]:
+    """Get the predicates making up a combined one.
+
+    Args:
+        predicate: The predicate to flatten.
+    """
+    if isinstance(predicate, _AllOf):
+        return tuple(flat for sub in predicate.predicates for flat in _flatten(sub))
+    return (predicate,)
@@ -1,5 +1,8 @@
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
+from threading import Lock
 from typing import Any, Callable, Concatenate, TypeVar
 
 from typing_extensions import ParamSpec
@@ -11,13 +14,57 @@ R = TypeVar("R")
 Func = Callable[Concatenate[OUT, P], R]
 
 
+class _Conversions:
+    """Converted events, by converter and event, each one converted once."""
+
+    def __init__(self) -> None:
+        self._values: dict[tuple[Callable[[Any], Any], int], Any] = {}
+        self._locks: dict[tuple[Callable[[Any], Any], int], Lock] = {}
+        self._lock = Lock()
+
+    def convert(self, converter: Callable[[Any], OUT], event: Any) -> OUT:
+        key = (converter, id(event))
+        try:
+            return self._values[key]  # type: ignore[no-any-return]
+        except KeyError:
+            pass
+
+        # Routes may run in threads, the lock of the key prevents converting twice,
+        # without waiting for the conversions of the other converters.
+        with self._lock:
+            lock = self._locks.setdefault(key, Lock())
+        with lock:
+            if key not in self._values:
+                self._values[key] = converter(event)
+            return self._values[key]  # type: ignore[no-any-return]
+
+
+_conversions: ContextVar[_Conversions | None] = ContextVar("conversions", default=None)
+
+
+@contextmanager
+def shared_conversions() -> Iterator[None]:
+    """Share the events converted by shared converters, inside the context.
+
+    The resolver shares them during the resolution of an event, between its routes.
+    """
+    token = _conversions.set(_Conversions())
+    try:
+        yield
+    finally:
+        _conversions.reset(token)
+
+
 def event_converter(
-    converter: Callable[[Event], OUT],
+    converter: Callable[[Event], OUT], *, shared: bool = False
 ) -> Callable[[Callable[Concatenate[OUT, P], R]], Callable[Concatenate[OUT, P], R]]:
     """Decorator that converts the raw event and inject it to the decorated function.
 
     Args:
         converter: The converter function that transform the raw event to the desired output.
+        shared: whether the converted event is only read by the decorated function,
+            so it can be shared with the other routes using the same converter.
+            The event is then converted once per resolution, instead of once per route.
 
     Returns:
         The decorated function.
@@ -26,7 +73,10 @@ def event_converter(
     def decorator(func: Callable[Concatenate[OUT, P], R]) -> Callable[Concatenate[OUT, P], R]:
         @wraps(func)
         def wrapper(event: Any, /, *args: P.args, **kwargs: P.kwargs) -> R:
-            return func(converter(event), *args, **kwargs)
+            conversions = _conversions.get() if shared else None
+            if conversions is None:
+                return func(converter(event), *args, **kwargs)
+            return func(conversions.convert(converter, event), *args, **kwargs)
 
         return wrapper
 
@@ -67,3 +67,34 @@ class MultipleRoutesError(RouteError):
             f"Available route functions are {', '.join(routes)}.\n"
             "If it's normal pass the option 'allow_multiple_routes' in the resolver definition."
         )
+
+
+class AmbiguousRoutesError(RouteError):
+    """Exception raised when several routes of the same priority match an event, in first match mode."""
+
+    def __init__(self, event: Mapping[Any, Any], routes: list[str]) -> None:
+        """Initialize the exception with the event and the ambiguous routes.
+
+        Args:
+            event: The event that caused the error.
+            routes: The list of matching route functions, of the same priority.
+        """
+        self.ambiguous_routes = routes
+        super().__init__(
+            f"Ambiguous routes found for the current event: {event}.\n"
+            f"Route functions {', '.join(routes)} match it with the same priority.\n"
+            "Give them distinct priorities, or make their conditions exclusive."
+        )
+
+
+class RuleSetError(PowerEventsError):
+    """Exception raised when a declarative rule set of routes is invalid."""
+
+    def __init__(self, errors: list[str]) -> None:
+        """Initialize the exception with the errors of the rule set.
+
+        Args:
+            errors: The errors found, each one prefixed by its location in the rule set.
+        """
+        self.errors = errors
+        super().__init__("Invalid rule set:\n" + "\n".join(f"- {error}" for error in errors))
@@ -0,0 +1,172 @@
+"""Lazy view over events received as raw JSON.
+
+Routing an event usually reads a few discriminator fields only, often the first ones of
+the document. A `JsonEvent` decodes the members of its object in order, only up to the
+requested key: the rest of the document is left undecoded until read. A requested nested
+object is itself a lazy view, over the same text. Skipped values are decoded by the `json`
+decoder and kept, so each value is decoded once at most.
+
+Route functions reading the whole event can get it decoded with `JsonEvent.decode`.
+The validity of the document is only checked up to the decoded members. Members are decoded
+under a lock shared by the views of a document, which routes may read from several threads.
+"""
+
+import json
+import re
+from collections.abc import Iterator, Mapping
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from threading import RLock
+from typing import Any, Union
+
+RawJson = Union[bytes, bytearray, memoryview]
+"""Types of the raw JSON events, encoded in UTF-8."""
+
+RAW_JSON_TYPES = (bytes, bytearray, memoryview)
+
+_DECODER = json.JSONDecoder()
+_WHITESPACES = re.compile(r"[ \t\n\r]*")
+
+
+class JsonEvent(Mapping[str, Any]):
+    """Read-only mapping over a JSON object, decoding its members on first access.
+
+    Keys are expected to be unique: the first member of a key is the one kept.
+    """
+
+    __slots__ = ("_end", "_lock", "_pos", "_resume", "_start", "_text", "_values")
+
+    def __init__(self, raw: RawJson | str) -> None:
+        """Initialize the view over the raw JSON object.
+
+        Args:
+            raw: The JSON document, its top-level value must be an object.
+
+        Raises:
+            JSONDecodeError: If the document does not start as a JSON object.
+        """
+        text = raw if isinstance(raw, str) else str(raw, "utf-8")
+        start = _skip_whitespaces(text, 0)
+        if not text.startswith("{", start):
+            raise json.JSONDecodeError("Expecting JSON object", text, start)
+        self._init(text, start, RLock())
+
+    def _init(self, text: str, start: int, lock: RLock) -> None:
+        self._text = text
+        self._lock = lock
+        """Lock of the decoding, shared by all the views of the document."""
+        self._start = start
+        self._pos = start + 1
+        """Position of the next member to decode."""
+        self._end: int | None = None
+        """Position after the object, once all its members are decoded."""
+        self._resume: JsonEvent | None = None
+        """Nested view of the last member, whose end is where to resume decoding."""
+        self._values: dict[str, Any] = {}
+
+    @classmethod
+    def _nested(cls, text: str, start: int, lock: RLock) -> "JsonEvent":
+        """Build the view of a nested object, over the same text."""
+        nested = cls.__new__(cls)
+        nested._init(text, start, lock)
+        return nested
+
+    def decode(self) -> dict[str, Any]:
+        """Decode the whole object, as `json.loads` would."""
+        return _DECODER.raw_decode(self._text, self._start)[0]  # type: ignore[no-any-return]
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key not in values and self._end is None:
+            self._decode_members(until=key)
+        return values[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self._values and self._end is None and isinstance(key, str):
+            self._decode_members(until=key)
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        self._decode_members()
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        self._decode_members()
+        return len(self._values)
+
+    def __reduce__(self) -> tuple[type["JsonEvent"], tuple[str]]:
+        # The lock can't be sent to another process, the view is rebuilt from its text.
+        return JsonEvent, (self._text[self._start : self._decode_members()],)
+
+    def __repr__(self) -> str:
+        return f"JsonEvent({self._text[self._start : self._decode_members()]})"
+
+    def _decode_members(self, until: str | None = None) -> int:
+        """Decode the next members, up to the given key if any, otherwise all of them.
+
+        Returns:
+            The position after the object, if all members are decoded, -1 otherwise.
+        """
+        if self._end is not None:
+            return self._end
+
+        with self._lock:
+            return self._decode_next_members(until)
+
+    def _decode_next_members(self, until: str | None) -> int:
+        """Decode the next members, holding the lock of the document."""
+        if self._end is not None:
+            return self._end
+
+        text, values, pos = self._text, self._values, self._pos
+        try:
+            if self._resume is not None:
+                pos = self._resume._decode_members()
+                self._resume = None
+                pos = self._next_member(_skip_whitespaces(text, pos))
+            elif pos == self._start + 1:
+                pos = _skip_whitespaces(text, pos)
+                if text[pos] == "}":
+                    self._end = pos + 1
+
+            while self._end is None:
+                if text[pos] != '"':
+                    raise json.JSONDecodeError(
+                        "Expecting property name enclosed in double quotes", text, pos
+                    )
+                key, pos = scanstring(text, pos + 1)
+                pos = _skip_whitespaces(text, pos)
+                if text[pos] != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+                pos = _skip_whitespaces(text, pos + 1)
+
+                if key == until and text[pos] == "{":
+                    values.setdefault(key, JsonEvent._nested(text, pos, self._lock))
+                    self._resume = values[key]
+                    return -1
+
+                value, pos = _DECODER.raw_decode(text, pos)
+                values.setdefault(key, value)
+                pos = self._next_member(_skip_whitespaces(text, pos))
+                if key == until:
+                    break
+        except IndexError:
+            raise json.JSONDecodeError("Unterminated object", text, pos) from None
+
+        self._pos = pos
+        return -1 if self._end is None else self._end
+
+    def _next_member(self, pos: int) -> int:
+        """Get the position of the next member, after the value ending at the position.
+
+        The end of the object is recorded when reached.
+        """
+        if self._text[pos] == "}":
+            self._end = pos + 1
+            return self._end
+        if self._text[pos] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", self._text, pos)
+        return _skip_whitespaces(self._text, pos + 1)
+
+
+def _skip_whitespaces(text: str, pos: int) -> int:
+    return _WHITESPACES.match(text, pos).end()  # type: ignore[union-attr]
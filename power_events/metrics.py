@@ -0,0 +1,238 @@
+"""Instrumentation of the event resolution.
+
+A resolver given a `MetricsSink` reports to it the condition checks of each route, the
+execution time of the route functions, the use of the fallback route and of the exception
+handlers. Without sink, nothing is measured.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from threading import Lock
+
+from typing_extensions import override
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+"""Upper bounds of the latency histogram buckets, in seconds."""
+
+_NS_PER_SECOND = 1e9
+_LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+class MetricsSink(ABC):
+    """Receiver of the measures taken while resolving events."""
+
+    @abstractmethod
+    def observe_check(self, route: str, duration_ns: int, *, matched: bool) -> None:
+        """Record the check of a route condition against an event.
+
+        Args:
+            route: The name of the route.
+            duration_ns: The duration of the check, in nanoseconds.
+            matched: whether the event matched the condition.
+        """
+
+    @abstractmethod
+    def observe_execution(self, route: str, duration_ns: int) -> None:
+        """Record the execution of a route function.
+
+        Args:
+            route: The name of the route.
+            duration_ns: The duration of the execution, in nanoseconds.
+        """
+
+    @abstractmethod
+    def count_fallback(self, route: str) -> None:
+        """Record the use of the fallback route, when no route matched an event.
+
+        Args:
+            route: The name of the fallback route.
+        """
+
+    @abstractmethod
+    def count_exception_handled(self, exc_type: type[Exception], handler: str) -> None:
+        """Record the handling of an exception raised while resolving an event.
+
+        Args:
+            exc_type: The type of the raised exception.
+            handler: The name of the exception handler.
+        """
+
+
+@dataclass
+class Histogram:
+    """Distribution of durations, in seconds, over fixed buckets."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(init=False)
+    """Number of observations by bucket, the last one being above all the bounds."""
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value: The observed value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass
+class CheckStats:
+    """Statistics of the checks of a route condition."""
+
+    checks: int = 0
+    matches: int = 0
+    time_ns: int = 0
+
+
+class InMemoryMetrics(MetricsSink):
+    """Metrics sink keeping aggregated measures in memory.
+
+    Its content can be exported in the Prometheus text format, with `to_prometheus`.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            buckets: The upper bounds of the latency histogram buckets, in seconds.
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._lock = Lock()
+        self.checks: dict[str, CheckStats] = {}
+        self.executions: dict[str, Histogram] = {}
+        self.fallbacks: Counter[str] = Counter()
+        self.exceptions_handled: Counter[tuple[str, str]] = Counter()
+
+    @override
+    def observe_check(self, route: str, duration_ns: int, *, matched: bool) -> None:
+        with self._lock:
+            stats = self.checks.get(route)
+            if stats is None:
+                stats = self.checks[route] = CheckStats()
+            stats.checks += 1
+            stats.matches += matched
+            stats.time_ns += duration_ns
+
+    @override
+    def observe_execution(self, route: str, duration_ns: int) -> None:
+        with self._lock:
+            histogram = self.executions.get(route)
+            if histogram is None:
+                histogram = self.executions[route] = Histogram(self._buckets)
+            histogram.observe(duration_ns / _NS_PER_SECOND)
+
+    @override
+    def count_fallback(self, route: str) -> None:
+        with self._lock:
+            self.fallbacks[route] += 1
+
+    @override
+    def count_exception_handled(self, exc_type: type[Exception], handler: str) -> None:
+        with self._lock:
+            self.exceptions_handled[exc_type.__name__, handler] += 1
+
+    def reset(self) -> None:
+        """Remove all the recorded measures."""
+        with self._lock:
+            self.checks.clear()
+            self.executions.clear()
+            self.fallbacks.clear()
+            self.exceptions_handled.clear()
+
+    def to_prometheus(self, prefix: str = "power_events") -> str:
+        """Get a snapshot of the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: The prefix of the metric names.
+        """
+        lines: list[str] = []
+        with self._lock:
+            _write_family(
+                lines,
+                f"{prefix}_condition_checks_total",
+                "counter",
+                "Number of checks of the route conditions.",
+                [({"route": r}, s.checks) for r, s in self.checks.items()],
+            )
+            _write_family(
+                lines,
+                f"{prefix}_condition_matches_total",
+                "counter",
+                "Number of events matching the route conditions.",
+                [({"route": r}, s.matches) for r, s in self.checks.items()],
+            )
+            _write_family(
+                lines,
+                f"{prefix}_condition_check_seconds_total",
+                "counter",
+                "Time spent checking the route conditions.",
+                [({"route": r}, s.time_ns / _NS_PER_SECOND) for r, s in self.checks.items()],
+            )
+            _write_histograms(
+                lines,
+                f"{prefix}_route_duration_seconds",
+                "Execution time of the route functions.",
+                self.executions,
+            )
+            _write_family(
+                lines,
+                f"{prefix}_fallbacks_total",
+                "counter",
+                "Number of events resolved by the fallback route.",
+                [({"route": r}, count) for r, count in self.fallbacks.items()],
+            )
+            _write_family(
+                lines,
+                f"{prefix}_exceptions_handled_total",
+                "counter",
+                "Number of exceptions handled by the exception handlers.",
+                [
+                    ({"exception": exc, "handler": handler}, count)
+                    for (exc, handler), count in self.exceptions_handled.items()
+                ],
+            )
+        return "".join(f"{line}\n" for line in lines)
+
+
+def _write_family(
+    lines: list[str],
+    name: str,
+    kind: str,
+    description: str,
+    samples: list[tuple[dict[str, str], float]],
+) -> None:
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} {kind}")
+    lines.extend(f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples)
+
+
+def _write_histograms(
+    lines: list[str], name: str, description: str, histograms: dict[str, Histogram]
+) -> None:
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} histogram")
+    for route, histogram in histograms.items():
+        cumulative = 0
+        bounds = [*map(_number, histogram.buckets), "+Inf"]
+        for bound, count in zip(bounds, histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels({'route': route, 'le': bound})} {cumulative}")
+        lines.append(f"{name}_sum{_labels({'route': route})} {_number(histogram.total)}")
+        lines.append(f"{name}_count{_labels({'route': route})} {histogram.count}")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    return "{" + ",".join(f'{k}="{v.translate(_LABEL_ESCAPES)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -0,0 +1,139 @@
+"""Rejection of raw JSON events which cannot match any route, before decoding them.
+
+Most route conditions compare values to string literals. When every route requires one
+of some literals to be in the event, an event whose raw payload contains none of them
+cannot match any route: it does not need to be decoded nor checked.
+
+A string value can only contain a literal, if the raw payload contains it as is or escaped.
+Payloads with escape sequences are never rejected.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from typing_extensions import Self
+
+from .conditions import And, Condition, Or, Value
+from .conditions.value import _Contains
+from .json_event import RawJson
+
+# Up to this number of literals, searching them one by one is faster than a combined regex.
+_MAX_SEPARATE_SEARCHES = 16
+_END = -1
+
+
+class LiteralPrefilter:
+    """Search of literals in raw JSON events, one of which is in any event matching a route."""
+
+    def __init__(self, literals: Iterable[str]) -> None:
+        """Initialize the search of the literals.
+
+        Args:
+            literals: The literals, one of which is required.
+        """
+        self.literals = frozenset(literals)
+        encoded = sorted(literal.encode() for literal in self.literals)
+
+        self._search: Callable[[bytes | bytearray], bool]
+        if b"" in encoded:
+            self._search = lambda _raw: True
+        elif len(encoded) <= _MAX_SEPARATE_SEARCHES:
+            self._search = lambda raw: any(literal in raw for literal in encoded)
+        else:
+            search = re.compile(_trie_pattern(encoded)).search
+            self._search = lambda raw: search(raw) is not None
+
+    @classmethod
+    def from_conditions(cls, conditions: Sequence[Condition]) -> Self | None:
+        """Build the prefilter of the conditions, if each one requires some string literals.
+
+        Args:
+            conditions: The conditions of the routes.
+        """
+        literals: set[str] = set()
+        for condition in conditions:
+            required = _required_literals(condition)
+            if required is None:
+                return None
+            literals |= required
+        return cls(literals)
+
+    def may_match(self, raw: RawJson) -> bool:
+        """Whether the raw event may match a route, by containing one of the literals.
+
+        Args:
+            raw: The raw JSON event, encoded in UTF-8.
+        """
+        data = raw.tobytes() if isinstance(raw, memoryview) else raw
+        if b"\\" in data:
+            return True
+        return self._search(data)
+
+
+def _required_literals(condition: Condition) -> frozenset[str] | None:
+    """Get the string literals one of which is required by the condition, if known.
+
+    Args:
+        condition: The condition to analyse.
+    """
+    # Exact values only, a subclass may check on its own.
+    if type(condition) is Value:
+        return _value_literals(condition)
+
+    if type(condition) is And:
+        candidates = [
+            literals
+            for sub_condition in condition.conditions
+            if (literals := _required_literals(sub_condition)) is not None
+        ]
+        # The fewest and longest literals are the most selective.
+        return min(
+            candidates, key=lambda lit: (len(lit), -min(map(len, lit), default=0)), default=None
+        )
+
+    if type(condition) is Or:
+        all_literals = [_required_literals(sub) for sub in condition.conditions]
+        if any(literals is None for literals in all_literals):
+            return None
+        return frozenset().union(*all_literals)  # type: ignore[arg-type]
+
+    return None
+
+
+def _value_literals(value: Value) -> frozenset[str] | None:
+    if value.has_mapper:
+        return None
+
+    expected = value.expected_values
+    if expected is not None and all(isinstance(val, str) for val in expected):
+        return expected
+
+    items: list[Any] = [
+        item
+        for predicate in value.predicates
+        if type(predicate) is _Contains
+        for item in predicate.items
+        if isinstance(item, str)
+    ]
+    return frozenset({max(items, key=len)}) if items else None
+
+
+def _trie_pattern(literals: Iterable[bytes]) -> bytes:
+    """Build a regex pattern matching any of the literals, factorized by common prefixes."""
+    trie: dict[int, Any] = {}
+    for literal in literals:
+        node = trie
+        for byte in literal:
+            node = node.setdefault(byte, {})
+        node[_END] = {}
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: dict[int, Any]) -> bytes:
+    if _END in node:
+        # Longer literals with this prefix contain it, matching it is enough.
+        return b""
+
+    branches = [re.escape(bytes([byte])) + _node_pattern(child) for byte, child in node.items()]
+    return branches[0] if len(branches) == 1 else b"(?:" + b"|".join(branches) + b")"
@@ -1,20 +1,50 @@
 import asyncio
-from collections.abc import Container, Mapping, Sequence
-from dataclasses import dataclass
+from collections import Counter, deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Container,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
 from logging import Logger
+from threading import Lock
+from time import perf_counter_ns
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     TypeVar,
+    cast,
     overload,
 )
 
 from maypy.predicates import is_empty
-from typing_extensions import Concatenate, ParamSpec
-
-from .conditions import Condition, Value
-from .exceptions import MultipleRoutesError, NoRouteFoundError
-from .utils.functions import run_async
+from typing_extensions import Concatenate, ParamSpec, Self, override
+
+from .conditions import And, Condition, Or, Value, ValuePath
+from .conditions.adaptive import AdaptiveCheck
+from .conditions.compiler import CompiledCondition, StrPath, code_cache, compile_condition
+from .conditions.condition import leaves
+from .conditions.normalize import normalize
+from .conditions.value import CachedEvent
+from .event import shared_conversions
+from .exceptions import AmbiguousRoutesError, MultipleRoutesError, NoRouteFoundError
+from .json_event import RAW_JSON_TYPES, JsonEvent, RawJson
+from .metrics import MetricsSink
+from .prefilter import LiteralPrefilter
+from .route_index import RouteIndex
+from .utils.cache import LRUCache
+from .utils.functions import run_in_executor
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -33,6 +63,18 @@ class EventRoute:
 
     func: Callable[..., Any]
     condition: Condition
+    blocking: bool | None = None
+    """Whether the synchronous function should be offloaded from the event loop,
+    `None` to follow the resolver policy."""
+    cpu_bound: bool = False
+    """Whether the function should run in the resolver process executor, if any."""
+    priority: int = 0
+    """Rank of the route in first match mode, the highest checked first."""
+    name: str = field(init=False, repr=False, compare=False)
+    """Name of the route function, its representation if it has no name."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", _func_name(self.func))
 
     def match(self, event: Mapping[str, V]) -> bool:
         """Check if the event matches the route's condition.
@@ -42,10 +84,224 @@ class EventRoute:
         """
         return self.condition.check(event)
 
-    @property
-    def name(self) -> str:
-        """Get the name of the route function."""
-        return self.func.__name__
+
+@dataclass(frozen=True, slots=True)
+class RouteTable:
+    """Dispatch structures built over a set of routes.
+
+    A table is never modified once built, apart from its caches: it can be read by concurrent
+    resolutions without lock. Registering new routes builds a new table.
+    """
+
+    routes: tuple[EventRoute, ...]
+    index: RouteIndex
+    shared_paths: frozenset[ValuePath]
+    checks: list[CompiledCondition]
+    """Compiled conditions of the routes, each one compiled on its first check."""
+    projection: tuple[ValuePath, ...] | None = None
+    """Paths of all the values read by the conditions, if they only depend on them."""
+    match_cache: LRUCache[tuple[Any, ...], tuple[int, ...]] | None = None
+    """Positions of the matching routes, by projection of the events."""
+    metrics: MetricsSink | None = None
+    """Sink of the condition checks measures, if any."""
+    prefilter: LiteralPrefilter | None = None
+    """Search of the literals required by the conditions, rejecting raw events early."""
+    fallback: EventRoute | None = None
+    """Route of the events matching no route, if any."""
+    exception_handlers: dict[type[Exception], Callable[..., Any] | None] = field(
+        default_factory=dict
+    )
+    """Handler of each exception type, the registered ones then the others once raised."""
+    first_match: bool = False
+    """Whether matching stops at the first matching route, also when routes are exclusive."""
+
+    @classmethod
+    def build(
+        cls,
+        routes: Sequence[EventRoute],
+        *,
+        adaptive: bool = False,
+        match_cache_size: int | None = None,
+        metrics: MetricsSink | None = None,
+        literal_prefilter: bool = False,
+        fallback: EventRoute | None = None,
+        exception_handlers: Mapping[type[Exception], Callable[..., Any]] | None = None,
+        precompile: bool = False,
+        by_priority: bool = False,
+        first_match: bool = False,
+    ) -> "RouteTable":
+        """Build the dispatch structures of the routes.
+
+        Args:
+            routes: The routes to dispatch events to.
+            adaptive: whether the sub-conditions are reordered from statistics sampled on events.
+            match_cache_size: The size of the cache of matching routes, if any.
+                It is only used when all the conditions are known to be pure.
+            metrics: The sink of the condition checks measures, if any.
+            literal_prefilter: whether raw events are searched for the literals required by the
+                conditions, before being decoded. Only used when all conditions require some.
+            fallback: The route of the events matching no route, if any.
+            exception_handlers: The handlers of the exceptions, by exception type.
+            precompile: whether the conditions are compiled now, instead of on their first check.
+            by_priority: whether the routes are ordered by priority, the highest first,
+                then by registration.
+            first_match: whether matching stops at the first matching route.
+                It always does when the routes are proven mutually exclusive.
+        """
+        if by_priority:
+            routes = sorted(routes, key=lambda route: -route.priority)
+        routes = tuple(routes)
+        index = RouteIndex([route.condition for route in routes])
+        if not first_match and len(routes) > 1 and next(index.overlapping(), None) is None:
+            logger.debug("Routes proven mutually exclusive, matching stops at the first match.")
+            first_match = True
+        path_reads = Counter(index.indexed_paths)
+        pure = True
+        for route in routes:
+            for leaf in leaves(route.condition):
+                # Exact values only, a subclass may check on its own.
+                if type(leaf) is Value:
+                    path_reads[leaf.path] += 1
+                    pure = pure and leaf.is_pure and bool(leaf.path.keys)
+                else:
+                    pure = False
+
+        match_cache: LRUCache[tuple[Any, ...], tuple[int, ...]] | None = None
+        if match_cache_size and pure:
+            match_cache = LRUCache(match_cache_size)
+        elif match_cache_size:
+            logger.warning("Match cache disabled, some route conditions are not known to be pure.")
+
+        prefilter: LiteralPrefilter | None = None
+        if literal_prefilter:
+            prefilter = LiteralPrefilter.from_conditions([route.condition for route in routes])
+            if prefilter is None:
+                logger.warning(
+                    "Literal prefilter disabled, some route conditions require no literal."
+                )
+
+        checks: list[CompiledCondition] = []
+        if precompile:
+            checks.extend(_compile(route.condition, adaptive=adaptive) for route in routes)
+        else:
+            checks.extend(
+                _CompileOnFirstCheck(checks, i, route.condition, adaptive=adaptive)
+                for i, route in enumerate(routes)
+            )
+
+        return cls(
+            routes=routes,
+            index=index,
+            shared_paths=frozenset(
+                path for path, reads in path_reads.items() if reads > 1 or match_cache is not None
+            ),
+            checks=checks,
+            projection=tuple(path_reads) if match_cache is not None else None,
+            match_cache=match_cache,
+            metrics=metrics,
+            prefilter=prefilter,
+            fallback=fallback,
+            exception_handlers=dict(exception_handlers or {}),
+            first_match=first_match,
+        )
+
+    def match(self, event: Mapping[Any, Any]) -> list[EventRoute]:
+        """Find the routes matching the event, only checking the indexed candidates.
+
+        Values read by several conditions are extracted once from the event.
+
+        Args:
+            event: The event to match.
+        """
+        view = CachedEvent(event, self.shared_paths)
+        if self.match_cache is None:
+            return [self.routes[position] for position in self._match_positions(view)]
+
+        key = tuple((type(value), value) for value in map(view.extract, self.projection or ()))
+        try:
+            positions = self.match_cache.get(key)
+        except TypeError:  # unhashable values
+            return [self.routes[position] for position in self._match_positions(view)]
+
+        if positions is None:
+            positions = tuple(self._match_positions(view))
+            self.match_cache.put(key, positions)
+        return [self.routes[position] for position in positions]
+
+    def exception_handler(self, exc_type: type[Exception]) -> Callable[..., Any] | None:
+        """Get the handler of the exception type, the one of its closest handled base if any.
+
+        Args:
+            exc_type: The type of the raised exception.
+        """
+        handlers = self.exception_handlers
+        try:
+            return handlers[exc_type]
+        except KeyError:
+            pass
+
+        handler = next((handlers[cls] for cls in exc_type.__mro__ if cls in handlers), None)
+        handlers[exc_type] = handler
+        return handler
+
+    def _match_positions(self, view: CachedEvent[Any]) -> list[int]:
+        """Get the positions of the routes matching the event."""
+        checks = self.checks
+        if self.metrics is None:
+            candidates = self.index.candidates(view)
+            if self.first_match:
+                for position in candidates:
+                    if checks[position](view):
+                        return [position]
+                return []
+            return [position for position in candidates if checks[position](view)]
+
+        positions = []
+        for position in self.index.candidates(view):
+            start = perf_counter_ns()
+            matched = checks[position](view)
+            self.metrics.observe_check(
+                self.routes[position].name, perf_counter_ns() - start, matched=matched
+            )
+            if matched:
+                positions.append(position)
+                if self.first_match:
+                    break
+        return positions
+
+
+class _CompileOnFirstCheck:
+    """Placeholder of a compiled condition, replacing itself by it on first check.
+
+    Compiling has a cost, it is only paid for the routes actually checked.
+    """
+
+    __slots__ = ("_adaptive", "_checks", "_condition", "_position")
+
+    def __init__(
+        self,
+        checks: list[CompiledCondition],
+        position: int,
+        condition: Condition,
+        *,
+        adaptive: bool = False,
+    ) -> None:
+        self._checks = checks
+        self._position = position
+        self._condition = condition
+        self._adaptive = adaptive
+
+    def __call__(self, event: Mapping[Any, Any]) -> bool:
+        compiled = _compile(self._condition, adaptive=self._adaptive)
+        self._checks[self._position] = compiled
+        return compiled(event)
+
+
+def _compile(condition: Condition, *, adaptive: bool = False) -> CompiledCondition:
+    """Compile the condition, into an adaptive check if its sub-conditions are reordered."""
+    if adaptive and isinstance(condition, (And, Or)):
+        return AdaptiveCheck(condition)
+    return compile_condition(condition)
 
 
 class EventRouter:
@@ -64,47 +320,137 @@ class EventRouter:
         self._allow_multiple_routes = allow_multiple_routes
         self._allow_no_route = allow_no_route
 
-    def equal(self, value_path: str, expected: Any) -> Callable[[Func[P]], Func[P]]:
+    def equal(
+        self,
+        value_path: str,
+        expected: Any,
+        *,
+        blocking: bool | None = None,
+        cpu_bound: bool = False,
+        priority: int = 0,
+    ) -> Callable[[Func[P]], Func[P]]:
         """Register a route with an equality condition.
 
         Args:
             value_path: The path to the value in the event.
             expected: The expected value.
+            blocking: whether the synchronous route should be offloaded from the event loop,
+                default to the resolver policy.
+            cpu_bound: whether the route should run in the resolver process executor, if any.
+            priority: The rank of the route in first match mode, the highest checked first.
         """
-        return self.when(Value(value_path).equals(expected))
-
-    def one_of(self, value_path: str, options: Container[V]) -> Callable[[Func[P]], Func[P]]:
+        return self.when(
+            Value(value_path).equals(expected),
+            blocking=blocking,
+            cpu_bound=cpu_bound,
+            priority=priority,
+        )
+
+    def one_of(
+        self,
+        value_path: str,
+        options: Container[V],
+        *,
+        blocking: bool | None = None,
+        cpu_bound: bool = False,
+        priority: int = 0,
+    ) -> Callable[[Func[P]], Func[P]]:
         """Register a route with a one-of condition.
 
         Args:
             value_path: The path to the value in the event.
             options: The container of expected values.
+            blocking: whether the synchronous route should be offloaded from the event loop,
+                default to the resolver policy.
+            cpu_bound: whether the route should run in the resolver process executor, if any.
+            priority: The rank of the route in first match mode, the highest checked first.
         """
-        return self.when(Value(value_path).one_of(options))
-
-    def contain(self, value_path: str, *items: V) -> Callable[[Func[P]], Func[P]]:
+        return self.when(
+            Value(value_path).one_of(options),
+            blocking=blocking,
+            cpu_bound=cpu_bound,
+            priority=priority,
+        )
+
+    def contain(
+        self,
+        value_path: str,
+        *items: V,
+        blocking: bool | None = None,
+        cpu_bound: bool = False,
+        priority: int = 0,
+    ) -> Callable[[Func[P]], Func[P]]:
         """Register a route where value should contain items.
 
         Args:
             value_path: The path to the value in the event.
             items: Items to in the event.
+            blocking: whether the synchronous route should be offloaded from the event loop,
+                default to the resolver policy.
+            cpu_bound: whether the route should run in the resolver process executor, if any.
+            priority: The rank of the route in first match mode, the highest checked first.
         """
-        return self.when(Value(value_path).contains(*items))
-
-    def when(self, condition: Condition) -> Callable[[Func[P]], Func[P]]:
+        return self.when(
+            Value(value_path).contains(*items),
+            blocking=blocking,
+            cpu_bound=cpu_bound,
+            priority=priority,
+        )
+
+    def when(
+        self,
+        condition: Condition,
+        *,
+        blocking: bool | None = None,
+        cpu_bound: bool = False,
+        priority: int = 0,
+    ) -> Callable[[Func[P]], Func[P]]:
         """Register a route with a custom condition.
 
+        Synchronous routes are run in a thread by default, not to block the event loop.
+        For quick functions, the thread hop can cost more than the function itself:
+        mark them as non-blocking to run them directly on the event loop.
+        On the contrary, CPU-bound routes can be marked to run in another process,
+        their function and the event must then be picklable.
+
         Args:
             condition: The condition to trigger this route.
+            blocking: whether the synchronous route should be offloaded from the event loop,
+                default to the resolver policy.
+            cpu_bound: whether the route should run in the resolver process executor, if any.
+            priority: The rank of the route in first match mode, the highest checked first.
         """
 
         def register_route(fn: Func[P]) -> Func[P]:
-            route = EventRoute(condition=condition, func=fn)
-            self._routes.append(route)
+            self._add_route(
+                EventRoute(
+                    condition=condition,
+                    func=fn,
+                    blocking=blocking,
+                    cpu_bound=cpu_bound,
+                    priority=priority,
+                )
+            )
             return fn
 
         return register_route
 
+    def _add_route(self, route: EventRoute) -> None:
+        """Register a new route.
+
+        Args:
+            route: The route to add.
+        """
+        self._routes.append(route)
+
+    def _add_routes(self, routes: Sequence[EventRoute]) -> None:
+        """Register new routes at once.
+
+        Args:
+            routes: The routes to add, in order.
+        """
+        self._routes.extend(routes)
+
     @overload
     def exception_handler(
         self, exc_type: type[Error]
@@ -126,11 +472,8 @@ class EventRouter:
         """
 
         def register_exception(fn: Callable[..., Any]) -> Callable[..., Any]:
-            if isinstance(exc_type, Sequence):
-                for exc in exc_type:
-                    self._exception_handlers[exc] = fn
-            else:
-                self._exception_handlers[exc_type] = fn
+            exc_types = exc_type if isinstance(exc_type, Sequence) else [exc_type]
+            self._add_exception_handlers(dict.fromkeys(exc_types, fn))
             return fn
 
         return register_exception
@@ -145,7 +488,7 @@ class EventRouter:
         """Register a fallback route if no registered routes match the event."""
 
         def register_fallback(fn: Func[P]) -> Func[P]:
-            self._fallback_route = EventRoute(fn, Value.root().match(lambda x: True))  # noqa: ARG005
+            self._set_fallback_route(EventRoute(fn, Value.root().match(lambda x: True)))  # noqa: ARG005
             return fn
 
         if func is None:
@@ -153,6 +496,24 @@ class EventRouter:
 
         return register_fallback(func)
 
+    def _add_exception_handlers(
+        self, handlers: Mapping[type[Exception], Callable[..., Any]]
+    ) -> None:
+        """Register exception handlers.
+
+        Args:
+            handlers: The handlers to add, by exception type.
+        """
+        self._exception_handlers.update(handlers)
+
+    def _set_fallback_route(self, route: EventRoute) -> None:
+        """Register the fallback route, replacing the previous one.
+
+        Args:
+            route: The fallback route.
+        """
+        self._fallback_route = route
+
 
 class EventResolver(EventRouter):
     """Resolves events by finding and executing matching routes from registered routers.
@@ -160,8 +521,147 @@ class EventResolver(EventRouter):
     This class extends `EventRouter` to provide a mechanism for resolving events
     against a collection of routes. It can include routes from other `EventRouter`
     instances and provides a central `resolve` method to process an event.
+
+    Route conditions are normalized at registration, then routes are dispatched through
+    a `RouteTable`, built on first resolution and rebuilt whenever new routes are registered.
+    Once frozen, the table is rebuilt at registration instead, and swapped in at once.
+
+    With `reuse_loop`, the resolver keeps its event loop between `resolve` calls,
+    it should then be closed, either by `close` or using it as a context manager.
     """
 
+    def __init__(
+        self,
+        *,
+        allow_multiple_routes: bool = False,
+        allow_no_route: bool = True,
+        reuse_loop: bool = False,
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None,
+        executor: Executor | None = None,
+        inline_single_route: bool = False,
+        process_executor: "ProcessPoolExecutor | None" = None,
+        adaptive_ordering: bool = False,
+        match_cache_size: int | None = None,
+        metrics: MetricsSink | None = None,
+        literal_prefilter: bool = False,
+        first_match: bool = False,
+        check_ambiguity: bool = False,
+    ) -> None:
+        """Initialize the event resolver with optional configuration.
+
+        Args:
+            allow_multiple_routes: option to allow multiples routes on same event, otherwise raise `MultipleRoutesError`.
+            allow_no_route: option to allow no routes on event, otherwise raise `NoRouteFoundError`.
+            reuse_loop: option to run all `resolve` calls on a single long-lived event loop,
+                instead of a new one for each event.
+            loop_factory: factory of the event loop used by `resolve`, default asyncio one otherwise.
+            executor: executor running the blocking synchronous routes, instead of the default one
+                of the event loop. It is not shut down by the resolver.
+            inline_single_route: option to run a synchronous route directly on the event loop,
+                when it is the only one to execute, unless marked as blocking.
+            process_executor: process pool running the routes marked as CPU-bound, otherwise they
+                are run as the blocking ones. It is not shut down by the resolver.
+            adaptive_ordering: option to reorder the sub-conditions of `And`/`Or` route conditions,
+                the cheapest and most selective first, from statistics sampled while resolving.
+                Conditions must be pure.
+            match_cache_size: option to cache the matching routes of the last events, by the values
+                read by the conditions. Only enabled if all the conditions are known to be pure:
+                built-in predicates without mapper.
+            metrics: sink of the measures taken while resolving events: condition checks, route
+                executions, fallback and exception handlers uses. Nothing is measured otherwise.
+            literal_prefilter: option to search raw JSON events for the string literals required
+                by the conditions, routing the ones containing none directly to the fallback.
+                Only enabled if each condition requires some, through `equals`, `one_of` or
+                `contains`.
+            first_match: option to resolve each event to its first matching route only, routes
+                being checked by priority, the highest first, then in order of registration.
+                The remaining routes are not checked.
+            check_ambiguity: option to check all the routes in first match mode, raising
+                `AmbiguousRoutesError` when the first matching routes share the same priority.
+                Meant for tests, it costs the checks first match mode avoids.
+
+        Raises:
+            ValueError: If the first match mode is set while allowing multiple routes.
+        """
+        if first_match and allow_multiple_routes:
+            raise ValueError("First match mode resolves to a single route, multiple are allowed")
+
+        super().__init__(allow_multiple_routes=allow_multiple_routes, allow_no_route=allow_no_route)
+        self._route_table: RouteTable | None = None
+        self._frozen = False
+        self._table_lock = Lock()
+        """Lock of the registrations and the builds of the route table, not of its reads."""
+        self._reuse_loop = reuse_loop
+        self._loop_factory = loop_factory
+        self._runner: asyncio.Runner | None = None
+        self._executor = executor
+        self._inline_single_route = inline_single_route
+        self._process_executor = process_executor
+        self._adaptive_ordering = adaptive_ordering
+        self._match_cache_size = match_cache_size
+        self._metrics = metrics
+        self._literal_prefilter = literal_prefilter
+        self._first_match = first_match
+        self._check_ambiguity = check_ambiguity
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the event loop kept by the resolver, if any.
+
+        A new one is created if events are resolved again.
+        """
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
+    def freeze(self, cache_path: StrPath | None = None) -> RouteTable:
+        """Build the dispatch table of the registered routes now, with their conditions compiled.
+
+        The table is immutable: concurrent resolutions read it without lock. From then on,
+        each registration builds a new table, swapped in at once. Resolutions in progress
+        keep the table they started with.
+
+        Args:
+            cache_path: The file caching the code of the compiled conditions, between processes.
+                It is loaded first, then saved if missing or if conditions of a new shape were
+                compiled. Only the codes are cached, the route table is still built.
+                Like `__pycache__` files, it holds Python bytecode and must be trusted:
+                it is ignored when not owned by the current user, or writable by others.
+
+        Returns:
+            The dispatch table.
+        """
+        loaded = cache_path is not None and code_cache.load(cache_path)
+
+        with self._table_lock:
+            self._frozen = True
+            table = self._route_table = self._build_route_table()
+
+        if cache_path is not None and (not loaded or code_cache.modified):
+            code_cache.save(cache_path)
+        return table
+
+    def overlapping_routes(self) -> list[tuple[EventRoute, EventRoute]]:
+        """Get the pairs of registered routes which may match a same event.
+
+        Routes are proven mutually exclusive when their conditions require the value at a same
+        path to be in disjoint sets, through `equals` and `one_of`. The other pairs are reported,
+        they may hide ambiguities. When none is reported, matching stops at the first match.
+
+        Returns:
+            The pairs of routes not proven exclusive, in order of their routes.
+        """
+        table = self._get_route_table()
+        return [
+            (table.routes[position], table.routes[other])
+            for position, other in table.index.overlapping()
+        ]
+
     def include_router(self, router: EventRouter, base_condition: Condition | None = None) -> None:
         """Include router routes and exception handlers into this resolver.
 
@@ -170,96 +670,416 @@ class EventResolver(EventRouter):
             base_condition: An optional condition to apply to all routes from the included router.
                             If provided, it will be combined with each route's existing condition.
         """
-        self._exception_handlers.update(router._exception_handlers)
+        routes = [
+            replace(route, condition=base_condition & route.condition) if base_condition else route
+            for route in router._routes
+        ]
+        normalized = [replace(route, condition=normalize(route.condition)) for route in routes]
+
+        with self._table_lock:
+            self._exception_handlers.update(router._exception_handlers)
+            self._routes.extend(normalized)
+            self._refresh_route_table()
+
+    def resolve(self, event: Mapping[Any, V] | RawJson) -> Sequence[Any]:
+        """Resolve the event to the matching routes and execute their functions.
 
-        for route in router._routes:
-            new_route = route
+        Events received as raw JSON objects, encoded in UTF-8, are resolved through a lazy
+        `JsonEvent` view: only the members read by the conditions and the route functions
+        are decoded.
 
-            if base_condition:
-                new_condition = base_condition & route.condition
-                new_route = EventRoute(route.func, new_condition)
+        Args:
+            event: The event to resolve.
+        """
+        if not self._reuse_loop:
+            with asyncio.Runner(loop_factory=self._loop_factory) as runner:
+                return runner.run(self.resolve_async(event))
+
+        if self._runner is None:
+            self._runner = asyncio.Runner(loop_factory=self._loop_factory)
+        return self._runner.run(self.resolve_async(event))
+
+    def resolve_stream(
+        self,
+        events: Iterable[Mapping[Any, V] | RawJson],
+        *,
+        concurrency: int = 16,
+        ordered: bool = True,
+    ) -> Generator[Sequence[Any], None, None]:
+        """Resolve a stream of events, with several events resolved concurrently.
+
+        Same as `resolve_stream_async`, from synchronous code. The events are pulled from the
+        iterable on the event loop, which waits for the next one.
 
-            self._routes.append(new_route)
+        Args:
+            events: The events to resolve.
+            concurrency: The maximum number of events being resolved at the same time.
+            ordered: whether the results are yielded in the order of the events,
+                otherwise as soon as they are available.
+        """
+        stream = self.resolve_stream_async(events, concurrency=concurrency, ordered=ordered)
+        if not self._reuse_loop:
+            with asyncio.Runner(loop_factory=self._loop_factory) as runner:
+                yield from _iterate_on(runner, stream)
+            return
+
+        if self._runner is None:
+            self._runner = asyncio.Runner(loop_factory=self._loop_factory)
+        yield from _iterate_on(self._runner, stream)
+
+    async def resolve_stream_async(
+        self,
+        events: AsyncIterable[Mapping[Any, V] | RawJson] | Iterable[Mapping[Any, V] | RawJson],
+        *,
+        concurrency: int = 16,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Sequence[Any], None]:
+        """Resolve a stream of events, with several events resolved concurrently.
+
+        The next event is only pulled from the source when less than `concurrency` events are
+        being resolved, and results are only produced as fast as they are consumed. While the
+        next event of an asynchronous source is awaited, resolved events are still yielded.
+        Each event is resolved as by `resolve_async`: its errors go through the exception
+        handlers, an unhandled one stops the stream and cancels the events being resolved.
 
-    def resolve(self, event: Mapping[Any, V]) -> Sequence[Any]:
-        """Resolve the event to the matching routes and execute their functions.
+        Args:
+            events: The events to resolve.
+            concurrency: The maximum number of events being resolved at the same time.
+            ordered: whether the results are yielded in the order of the events,
+                otherwise as soon as they are available.
+
+        Yields:
+            The results of each event, as returned by `resolve_async`.
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency should be positive, got {concurrency}")
+
+        in_flight: deque[asyncio.Task[Sequence[Any]]] = deque()
+        pull: asyncio.Task[Any] | None = None
+        try:
+            if not isinstance(events, AsyncIterable):
+                for event in events:
+                    in_flight.append(asyncio.ensure_future(self.resolve_async(event)))
+                    if len(in_flight) >= concurrency:
+                        for results in await _next_results(in_flight, ordered=ordered):
+                            yield results
+            else:
+                source = events.__aiter__()
+                pull = asyncio.ensure_future(_next_item(source, _END))
+                while pull is not None:
+                    awaited = [in_flight[0]] if ordered and in_flight else [*in_flight]
+                    await asyncio.wait([pull, *awaited], return_when=asyncio.FIRST_COMPLETED)
+                    if pull.done():
+                        event = pull.result()
+                        if event is _END:
+                            break
+                        in_flight.append(asyncio.ensure_future(self.resolve_async(event)))
+
+                    for results in _resolved_results(in_flight, ordered=ordered):
+                        yield results
+
+                    if pull.done():
+                        pull = None
+                    while pull is None and len(in_flight) >= concurrency:
+                        for results in await _next_results(in_flight, ordered=ordered):
+                            yield results
+                    if pull is None:
+                        pull = asyncio.ensure_future(_next_item(source, _END))
+
+            while in_flight:
+                for results in await _next_results(in_flight, ordered=ordered):
+                    yield results
+        finally:
+            pending = [*in_flight, *([pull] if pull is not None else [])]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def resolve_async(self, event: Mapping[Any, V] | RawJson) -> Sequence[Any]:
+        """Resolve the event to the matching routes and await their functions, on the running loop.
+
+        Same as `resolve`, but usable inside an already running event loop.
 
         Args:
             event: The event to resolve.
         """
-        available_routes = self._find_matching_routes(event)
+        table = self._get_route_table()
         try:
-            self._handle_not_found(event, available_routes)
-            self._handle_multiple_routes(event, available_routes)
+            view, available_routes = self._find_matching_routes(table, event)
+            self._handle_not_found(view, available_routes, table)
+            available_routes = self._handle_multiple_routes(view, available_routes)
 
-            return asyncio.run(self._run_all_routes(available_routes, event))
+            with shared_conversions():
+                return await self._run_all_routes(available_routes, view)
 
         except Exception as exc:
-            handler = self._lookup_exception_handler(type(exc))
+            handler = table.exception_handler(type(exc))
             if handler:
+                if self._metrics is not None:
+                    self._metrics.count_exception_handled(type(exc), _func_name(handler))
                 return [handler(exc)]
 
             raise
 
-    @staticmethod
-    async def _run_all_routes(routes: list[EventRoute], event: Any) -> Sequence[Any]:
+    async def _run_all_routes(self, routes: list[EventRoute], event: Any) -> Sequence[Any]:
         """Execute all matching routes and execute their functions.
 
         Args:
             routes: The routes to execute.
             event: The current event to execute.
         """
-        return await asyncio.gather(*(run_async(route.func, event) for route in routes))
+        if len(routes) == 1:
+            return [await self._run_route(routes[0], event, alone=True)]
+
+        return await asyncio.gather(*(self._run_route(route, event) for route in routes))
+
+    async def _run_route(self, route: EventRoute, event: Any, *, alone: bool = False) -> Any:
+        """Execute the route function, measuring its execution time if metrics are enabled.
+
+        Args:
+            route: The route to execute.
+            event: The current event to execute.
+            alone: whether it is the only route to execute for the event.
+        """
+        if self._metrics is None:
+            return await self._execute_route(route, event, alone=alone)
+
+        start = perf_counter_ns()
+        try:
+            return await self._execute_route(route, event, alone=alone)
+        finally:
+            self._metrics.observe_execution(route.name, perf_counter_ns() - start)
+
+    async def _execute_route(self, route: EventRoute, event: Any, *, alone: bool = False) -> Any:
+        """Execute the route function, according to the execution policy.
+
+        Args:
+            route: The route to execute.
+            event: The current event to execute.
+            alone: whether it is the only route to execute for the event.
+        """
+        if asyncio.iscoroutinefunction(route.func):
+            return await route.func(event)
+
+        if route.cpu_bound and self._process_executor is not None:
+            return await run_in_executor(self._process_executor, route.func, event)
 
-    def _find_matching_routes(self, event: Mapping[Any, V]) -> list[EventRoute]:
-        """Find the routes matching the event."""
-        matching_routes = [route for route in self._routes if route.match(event)]
+        blocking = route.blocking
+        if blocking is None:
+            blocking = not (alone and self._inline_single_route)
 
-        if is_empty(matching_routes) and self._fallback_route:
+        if not blocking:
+            return route.func(event)
+
+        return await run_in_executor(self._executor, route.func, event)
+
+    @override
+    def _add_route(self, route: EventRoute) -> None:
+        self._add_routes((route,))
+
+    @override
+    def _add_routes(self, routes: Sequence[EventRoute]) -> None:
+        normalized = [replace(route, condition=normalize(route.condition)) for route in routes]
+        with self._table_lock:
+            super()._add_routes(normalized)
+            self._refresh_route_table()
+
+    @override
+    def _add_exception_handlers(
+        self, handlers: Mapping[type[Exception], Callable[..., Any]]
+    ) -> None:
+        with self._table_lock:
+            super()._add_exception_handlers(handlers)
+            self._refresh_route_table()
+
+    @override
+    def _set_fallback_route(self, route: EventRoute) -> None:
+        with self._table_lock:
+            super()._set_fallback_route(route)
+            self._refresh_route_table()
+
+    def _refresh_route_table(self) -> None:
+        """Replace the outdated route table, by a new one if frozen, otherwise on next use.
+
+        Must be called holding the table lock.
+        """
+        self._route_table = self._build_route_table() if self._frozen else None
+
+    def _build_route_table(self) -> RouteTable:
+        """Build the dispatch structures of the registered routes."""
+        return RouteTable.build(
+            self._routes,
+            adaptive=self._adaptive_ordering,
+            match_cache_size=self._match_cache_size,
+            metrics=self._metrics,
+            literal_prefilter=self._literal_prefilter,
+            fallback=self._fallback_route,
+            exception_handlers=self._exception_handlers,
+            precompile=self._frozen,
+            by_priority=self._first_match,
+            first_match=self._first_match and not self._check_ambiguity,
+        )
+
+    def _get_route_table(self) -> RouteTable:
+        """Get the dispatch structures of the registered routes, building them if outdated."""
+        table = self._route_table
+        if table is None:
+            with self._table_lock:
+                table = self._route_table
+                if table is None:
+                    table = self._route_table = self._build_route_table()
+        return table
+
+    def _find_matching_routes(
+        self, table: RouteTable, event: Mapping[Any, V] | RawJson
+    ) -> tuple[Mapping[Any, V], list[EventRoute]]:
+        """Find the routes of the table matching the event.
+
+        Raw JSON events are searched by the literal prefilter first, if any. They are read
+        through a `JsonEvent` view, only built when the event is still read once rejected:
+        by the fallback route, or the error of no route found.
+
+        Returns:
+            The event, a view if raw JSON still read, and its matching routes.
+        """
+        matching_routes: list[EventRoute] = []
+        if not isinstance(event, RAW_JSON_TYPES):
+            view = event
+            matching_routes = table.match(view)
+        elif table.prefilter is None or table.prefilter.may_match(event):
+            view = JsonEvent(event)
+            matching_routes = table.match(view)
+        elif table.fallback or not self._allow_no_route:
+            view = JsonEvent(event)
+        else:
+            # Rejected and unread: no route, nor error, to hand the view to.
+            view = cast("Mapping[Any, V]", event)
+
+        if is_empty(matching_routes) and table.fallback:
             logger.debug("Use fallback route.")
-            return [self._fallback_route]
+            if self._metrics is not None:
+                self._metrics.count_fallback(table.fallback.name)
+            return view, [table.fallback]
 
-        return matching_routes
+        return view, matching_routes
 
-    def _handle_not_found(self, event: Mapping[Any, V], available_routes: list[EventRoute]) -> None:
+    def _handle_not_found(
+        self, event: Mapping[Any, V], available_routes: list[EventRoute], table: RouteTable
+    ) -> None:
         """Handle cases where no routes match the event.
 
         Args:
             event: The event to resolve.
             available_routes: The list of matching routes.
+            table: The route table the event is resolved by.
 
         Raises:
             NoRouteFoundError: If no routes are found and not allowed.
         """
         if is_empty(available_routes):
             if not self._allow_no_route:
-                raise NoRouteFoundError(event, [route.name for route in self._routes])
+                raise NoRouteFoundError(event, [route.name for route in table.routes])
 
             logger.warning("No routes for this event")  # pragma: no cover
 
     def _handle_multiple_routes(
         self, event: Mapping[Any, V], available_routes: list[EventRoute]
-    ) -> None:
+    ) -> list[EventRoute]:
         """Handle cases where multiple routes match the event.
 
+        In first match mode, all the routes are only matched to check their ambiguity.
+
         Args:
             event: The event to resolve.
             available_routes: The list of matching routes.
 
+        Returns:
+            The routes to execute.
+
         Raises:
             MultipleRoutesError: If multiple routes are found and not allowed.
+            AmbiguousRoutesError: If the first matching routes share the same priority.
         """
         if len(available_routes) > 1:
+            if self._first_match:
+                first, second = available_routes[:2]
+                if first.priority == second.priority:
+                    ambiguous = [r.name for r in available_routes if r.priority == first.priority]
+                    raise AmbiguousRoutesError(event, ambiguous)
+                return available_routes[:1]
+
             if not self._allow_multiple_routes:
                 raise MultipleRoutesError(event, [route.name for route in available_routes])
             logger.warning("Multiple routes for this event")  # pragma: no cover
+        return available_routes
 
-    def _lookup_exception_handler(
-        self, exc_type: type[Exception]
-    ) -> Callable[[Exception], Any] | None:
-        """Lookup the handler for the exception using Method Resolution Order, for matching against base exception."""
-        for cls in exc_type.__mro__:
-            if cls in self._exception_handlers:
-                return self._exception_handlers[cls]
 
-        return None
+async def _next_results(
+    in_flight: deque[asyncio.Task[Sequence[Any]]], *, ordered: bool
+) -> list[Sequence[Any]]:
+    """Wait for the next resolved events, removing them from the ones in flight.
+
+    Args:
+        in_flight: The tasks resolving the events, in the order of the events.
+        ordered: whether to wait for the first event, otherwise for any event.
+    """
+    if ordered:
+        results = await in_flight[0]
+        in_flight.popleft()
+        return [results]
+
+    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+    completed = [task for task in in_flight if task in done]
+    for task in completed:
+        in_flight.remove(task)
+    return [task.result() for task in completed]
+
+
+def _func_name(func: Callable[..., Any]) -> str:
+    """Get the name of the function, its representation for callables with no name."""
+    return getattr(func, "__name__", None) or repr(func)
+
+
+def _resolved_results(
+    in_flight: deque[asyncio.Task[Sequence[Any]]], *, ordered: bool
+) -> Iterator[Sequence[Any]]:
+    """Get the results of the events already resolved, removing them from the ones in flight.
+
+    Args:
+        in_flight: The tasks resolving the events, in the order of the events.
+        ordered: whether to stop at the first event not resolved yet.
+    """
+    if ordered:
+        while in_flight and in_flight[0].done():
+            yield in_flight.popleft().result()
+        return
+
+    for task in [task for task in in_flight if task.done()]:
+        in_flight.remove(task)
+        yield task.result()
+
+
+async def _next_item(iterator: AsyncIterator[T], default: K) -> T | K:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return default
+
+
+_END = object()
+
+
+def _iterate_on(
+    runner: asyncio.Runner, iterator: AsyncGenerator[T, None]
+) -> Generator[T, None, None]:
+    """Iterate synchronously over the asynchronous iterator, run by the runner.
+
+    Args:
+        runner: The runner of the event loop.
+        iterator: The asynchronous iterator.
+    """
+    try:
+        while (item := runner.run(_next_item(iterator, _END))) is not _END:
+            yield cast(T, item)
+    finally:
+        runner.run(iterator.aclose())
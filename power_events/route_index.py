@@ -0,0 +1,273 @@
+import re
+from collections import Counter
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+from maypy.predicates import match_regex
+
+from .conditions import And, Condition, Or, Value, ValuePath
+from .conditions.value import ABSENT
+
+_MATCH_REGEX_TYPE = type(match_regex(""))
+# Flags which can be scoped to a part of a pattern.
+_SCOPABLE_FLAGS = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+    re.ASCII: "a",
+}
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+# Group references, which would be broken by combining patterns.
+_GROUP_REFERENCES = re.compile(r"\\[1-9]|\\g<|\(\?P=|\(\?\(")
+
+
+class RouteIndex:
+    """Hash index of route conditions, keyed by the values they expect at a given path.
+
+    Conditions bound to a finite set of values at some path, through `Value.equals` and
+    `Value.one_of` (even nested inside `And`, or inside all the branches of `Or`), are indexed
+    on it. Otherwise, conditions
+    requiring the value at some path to match regex patterns, through `Value.match_regex`,
+    are indexed by a single regex per path, combining all their patterns.
+    Looking up an event only returns the positions of the conditions which can match, the
+    ones that could not be indexed are always returned. Candidates still have to be fully
+    checked. Subclasses of the conditions are not indexed, they may check on their own.
+    """
+
+    def __init__(self, conditions: Sequence[Condition]) -> None:
+        """Build the index over the given conditions.
+
+        Args:
+            conditions: The conditions to index, their position is used as identifier.
+        """
+        self._unindexed: list[int] = []
+        self._buckets: dict[ValuePath, dict[Any, list[int]]] = {}
+        regex_alternatives: dict[ValuePath, list[tuple[int, list[re.Pattern[str]]]]] = {}
+
+        all_keys = [_index_keys(condition) for condition in conditions]
+        self._keys = all_keys
+        path_usage = Counter(path for keys in all_keys for path in keys)
+
+        for position, keys in enumerate(all_keys):
+            if not keys:
+                regex_keys = _regex_keys(conditions[position])
+                if regex_keys is None or not all(map(_is_combinable, regex_keys[1])):
+                    self._unindexed.append(position)
+                else:
+                    path, patterns = regex_keys
+                    regex_alternatives.setdefault(path, []).append((position, patterns))
+                continue
+
+            path = _most_shared_path(keys, path_usage)
+            bucket = self._buckets.setdefault(path, {})
+            for value in keys[path]:
+                bucket.setdefault(value, []).append(position)
+
+        self._regexes = [
+            _CombinedRegex(path, alternatives) for path, alternatives in regex_alternatives.items()
+        ]
+
+    @property
+    def indexed_paths(self) -> list[ValuePath]:
+        """The paths looked up on each event."""
+        return [*self._buckets, *(regex.path for regex in self._regexes)]
+
+    def candidates(self, event: Mapping[Any, Any]) -> list[int]:
+        """Get the ordered positions of the conditions which can match the event.
+
+        Args:
+            event: The event to look up.
+        """
+        if not self._buckets and not self._regexes:
+            return self._unindexed
+
+        positions = list(self._unindexed)
+        for path, bucket in self._buckets.items():
+            if (value := path.get_from(event)) is ABSENT:
+                continue
+            try:
+                positions.extend(bucket.get(value, ()))
+            except TypeError:
+                # Unhashable value, let the conditions decide.
+                positions.extend({p for matched in bucket.values() for p in matched})
+
+        for regex in self._regexes:
+            if (value := regex.path.get_from(event)) is not ABSENT:
+                positions.extend(regex.matching(value))
+
+        positions.sort()
+        return positions
+
+    def overlapping(self) -> Iterator[tuple[int, int]]:
+        """Get the ordered pairs of positions of the conditions which may match a same event.
+
+        Two conditions are proven mutually exclusive when both are bound at some path to
+        disjoint sets of values. The pairs which could not be proven so are yielded, lazily.
+        """
+        count = len(self._keys)
+        bound: dict[ValuePath, set[int]] = {}
+        buckets: dict[ValuePath, dict[Any, list[int]]] = {}
+        for position, keys in enumerate(self._keys):
+            for path, values in keys.items():
+                bound.setdefault(path, set()).add(position)
+                bucket = buckets.setdefault(path, {})
+                for value in values:
+                    bucket.setdefault(value, []).append(position)
+        unbound = {path: set(range(count)) - positions for path, positions in bound.items()}
+
+        for position, keys in enumerate(self._keys):
+            if not keys:
+                yield from ((position, other) for other in range(position + 1, count))
+                continue
+
+            # Start from the most selective path, the others filter its candidates.
+            first, *others = sorted(keys, key=lambda path: len(unbound[path]))
+            candidates = {other for value in keys[first] for other in buckets[first][value]}
+            candidates |= unbound[first]
+            for path in others:
+                candidates = {
+                    other
+                    for other in candidates
+                    if other in unbound[path] or not keys[path].isdisjoint(self._keys[other][path])
+                }
+
+            yield from ((position, other) for other in sorted(candidates) if other > position)
+
+
+def _index_keys(condition: Condition) -> dict[ValuePath, frozenset[Any]]:
+    """Collect the values a condition is bound to, by path.
+
+    Args:
+        condition: The condition to analyse.
+    """
+    if type(condition) is Value:
+        expected = condition.expected_values
+        return {} if expected is None else {condition.path: expected}
+
+    keys: dict[ValuePath, frozenset[Any]] = {}
+    if type(condition) is And:
+        for sub_condition in condition.conditions:
+            for path, expected in _index_keys(sub_condition).items():
+                keys[path] = keys[path] & expected if path in keys else expected
+
+    elif type(condition) is Or and condition.conditions:
+        # Only the paths bound by all the branches, to any of their values.
+        first, *others = [_index_keys(sub_condition) for sub_condition in condition.conditions]
+        for path, expected in first.items():
+            if all(path in other for other in others):
+                keys[path] = expected.union(*(other[path] for other in others))
+
+    return keys
+
+
+def _most_shared_path(
+    keys: dict[ValuePath, frozenset[Any]], path_usage: Counter[ValuePath]
+) -> ValuePath:
+    """Choose the path to index a condition on, the fewer distinct paths the fewer lookups.
+
+    Args:
+        keys: The values the condition is bound to, by path.
+        path_usage: The number of conditions bound on each path.
+    """
+    return max(keys, key=lambda path: (path_usage[path], -len(keys[path])))
+
+
+class _CombinedRegex:
+    """Single regex matching a value against the patterns of several conditions at once.
+
+    Each pattern is wrapped in an optional lookahead, capturing whether it matches at the
+    start of the value, exactly as `re.Pattern.match`.
+    """
+
+    def __init__(
+        self, path: ValuePath, alternatives: list[tuple[int, list[re.Pattern[str]]]]
+    ) -> None:
+        """Combine the patterns of the conditions.
+
+        Args:
+            path: The path of the value to match.
+            alternatives: The patterns of each condition position, one of which is required.
+        """
+        self.path = path
+        self._positions = list(dict.fromkeys(position for position, _ in alternatives))
+        self._groups: list[tuple[int, int]] = []
+
+        parts: list[str] = []
+        group = 1
+        for position, patterns in alternatives:
+            for pattern in patterns:
+                parts.append(f"(?:(?=({_scoped(pattern)})))?")
+                self._groups.append((group, position))
+                group += 1 + pattern.groups
+
+        self._regex = re.compile("".join(parts))
+
+    def matching(self, value: Any) -> list[int]:
+        """Get the positions of the conditions whose patterns match the value.
+
+        Args:
+            value: The value at the path, all positions are returned if not a string.
+        """
+        if not isinstance(value, str):
+            # Let the conditions decide, as they would.
+            return self._positions
+
+        spans = self._regex.match(value).regs  # type: ignore[union-attr]
+        return list(
+            dict.fromkeys(position for group, position in self._groups if spans[group][0] >= 0)
+        )
+
+
+def _regex_keys(condition: Condition) -> tuple[ValuePath, list[re.Pattern[str]]] | None:
+    """Get the patterns, one of which the value at some path must match for the condition.
+
+    Args:
+        condition: The condition to analyse.
+    """
+    if type(condition) is Value:
+        if condition.has_mapper:
+            return None
+        patterns = [p.pattern for p in condition.predicates if type(p) is _MATCH_REGEX_TYPE]  # type: ignore[attr-defined]
+        # All the patterns are required, the first is enough.
+        return (condition.path, patterns[:1]) if patterns else None
+
+    if type(condition) is And:
+        for sub_condition in condition.conditions:
+            if (keys := _regex_keys(sub_condition)) is not None:
+                return keys
+        return None
+
+    if type(condition) is Or and condition.conditions:
+        all_keys = [_regex_keys(sub_condition) for sub_condition in condition.conditions]
+        paths = {keys[0] if keys else None for keys in all_keys}
+        if len(paths) != 1 or None in paths:
+            return None
+        return all_keys[0][0], [p for keys in all_keys for p in keys[1]]  # type: ignore[index]
+
+    return None
+
+
+def _is_combinable(pattern: re.Pattern[str]) -> bool:
+    """Whether the pattern keeps its meaning, once combined with other patterns."""
+    flags = pattern.flags & ~re.UNICODE
+    return (
+        isinstance(pattern.pattern, str)
+        and not pattern.groupindex
+        and not _GROUP_REFERENCES.search(pattern.pattern)
+        and all(flag in _SCOPABLE_FLAGS for flag in re.RegexFlag(flags))
+    )
+
+
+def _scoped(pattern: re.Pattern[str]) -> str:
+    """Get the source of the pattern, with its flags scoped to it."""
+    source = pattern.pattern
+    # Global flags are already part of the pattern flags.
+    while match := _GLOBAL_FLAGS.match(source):
+        source = source[match.end() :]
+
+    flags = "".join(letter for flag, letter in _SCOPABLE_FLAGS.items() if pattern.flags & flag)
+    if not flags:
+        return source
+    # A comment of a verbose pattern would hide the end of the group.
+    return f"(?{flags}:{source}\n)" if pattern.flags & re.VERBOSE else f"(?{flags}:{source})"
@@ -0,0 +1,231 @@
+"""Loading of routes from a declarative rule set, such as a JSON or TOML configuration.
+
+A rule set lists routes, each one a condition and the name of its handler function:
+
+```json
+{
+  "routes": [
+    {
+      "handler": "handle_order",
+      "when": {
+        "all": [
+          {"path": "type", "op": "one_of", "value": ["order_created", "order_updated"]},
+          {"not": {"path": "detail.test", "op": "is_truthy"}}
+        ]
+      },
+      "blocking": false
+    }
+  ]
+}
+```
+
+Conditions are either a check of the value at `path`, by the operator `op` and its operand
+`value` if it takes one, or the combination of other conditions by `all`, `any` or `not`.
+The whole rule set is checked before any route is registered, then all the routes are
+registered at once.
+"""
+
+import json
+import re
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import tomllib
+
+from .conditions import And, Condition, Neg, Or, Value
+from .exceptions import RuleSetError
+from .resolver import EventRoute, EventRouter
+
+_NO_OPERAND = object()
+
+
+def _check_no_operand(operand: Any) -> str | None:
+    return None if operand is _NO_OPERAND else "takes no value"
+
+
+def _check_any_operand(operand: Any) -> str | None:
+    return "requires a value" if operand is _NO_OPERAND else None
+
+
+def _check_list_operand(operand: Any) -> str | None:
+    return None if isinstance(operand, list) and operand else "requires a non-empty list"
+
+
+def _check_regex_operand(operand: Any) -> str | None:
+    if not isinstance(operand, str):
+        return "requires a string"
+    try:
+        re.compile(operand)
+    except re.error as exc:
+        return f"has an invalid regex: {exc}"
+    return None
+
+
+def _check_length_operand(operand: Any) -> str | None:
+    if type(operand) is not int or operand < 0:
+        return "requires a non-negative integer"
+    return None
+
+
+_OPERATORS: dict[str, tuple[Callable[[Any], str | None], Callable[[Value, Any], Value]]] = {
+    "equals": (_check_any_operand, Value.equals),
+    "one_of": (_check_list_operand, Value.one_of),
+    "contains": (_check_list_operand, lambda value, items: value.contains(*items)),
+    "match_regex": (_check_regex_operand, Value.match_regex),
+    "is_length": (_check_length_operand, Value.is_length),
+    "is_truthy": (_check_no_operand, lambda value, _: value.is_truthy()),
+    "is_falsy": (_check_no_operand, lambda value, _: value.is_falsy()),
+    "is_not_empty": (_check_no_operand, lambda value, _: value.is_not_empty()),
+}
+"""Check of the operand and builder of the value condition, by operator."""
+
+_ROUTE_KEYS = {"handler", "when", "blocking", "cpu_bound", "priority"}
+_VALUE_KEYS = {"path", "op", "value"}
+
+
+def load_rules(
+    router: EventRouter, rules: Mapping[str, Any], handlers: Mapping[str, Callable[..., Any]]
+) -> None:
+    """Register the routes of the rule set, all at once.
+
+    Args:
+        router: The router to register the routes to.
+        rules: The rule set, with its list of routes under `routes`.
+        handlers: The route functions, by name.
+
+    Raises:
+        RuleSetError: If the rule set is invalid, no route is then registered.
+    """
+    parser = _RuleParser(handlers)
+    routes = parser.routes(rules)
+    if parser.errors:
+        raise RuleSetError(parser.errors)
+    router._add_routes(routes)
+
+
+def load_rules_file(
+    router: EventRouter, path: str | Path, handlers: Mapping[str, Callable[..., Any]]
+) -> None:
+    """Register the routes of the rule set file, in TOML if its extension is `.toml`, else JSON.
+
+    Args:
+        router: The router to register the routes to.
+        path: The path of the rule set file.
+        handlers: The route functions, by name.
+
+    Raises:
+        RuleSetError: If the rule set is invalid, no route is then registered.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    try:
+        rules = tomllib.loads(data.decode()) if path.suffix == ".toml" else json.loads(data)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise RuleSetError([f"{path}: {exc}"]) from exc
+    load_rules(router, rules, handlers)
+
+
+class _RuleParser:
+    """Builder of the routes of a rule set, collecting its errors with their location."""
+
+    def __init__(self, handlers: Mapping[str, Callable[..., Any]]) -> None:
+        self.handlers = handlers
+        self.errors: list[str] = []
+
+    def routes(self, rules: Any) -> list[EventRoute]:
+        routes = rules.get("routes") if isinstance(rules, Mapping) else None
+        if not isinstance(routes, list):
+            self.errors.append("rules: requires a list of routes under 'routes'")
+            return []
+
+        parsed = (self.route(rule, f"routes[{i}]") for i, rule in enumerate(routes))
+        return [route for route in parsed if route is not None]
+
+    def route(self, rule: Any, location: str) -> EventRoute | None:
+        if not isinstance(rule, Mapping):
+            self.errors.append(f"{location}: requires a table of the route")
+            return None
+        if unknown := rule.keys() - _ROUTE_KEYS:
+            self.errors.append(f"{location}: unknown keys {sorted(unknown)}")
+
+        name = rule.get("handler")
+        func = self.handlers.get(name) if isinstance(name, str) else None
+        if func is None:
+            self.errors.append(f"{location}.handler: unknown handler {name!r}")
+
+        blocking = rule.get("blocking")
+        cpu_bound = rule.get("cpu_bound", False)
+        if blocking is not None and type(blocking) is not bool:
+            self.errors.append(f"{location}.blocking: requires a boolean")
+        if type(cpu_bound) is not bool:
+            self.errors.append(f"{location}.cpu_bound: requires a boolean")
+        priority = rule.get("priority", 0)
+        if type(priority) is not int:
+            self.errors.append(f"{location}.priority: requires an integer")
+
+        condition = self.condition(rule.get("when"), f"{location}.when")
+        if func is None or condition is None:
+            return None
+        return EventRoute(
+            func, condition, blocking=blocking, cpu_bound=cpu_bound, priority=priority
+        )
+
+    def condition(self, spec: Any, location: str) -> Condition | None:
+        if not isinstance(spec, Mapping):
+            self.errors.append(f"{location}: requires a table of the condition")
+            return None
+
+        if "path" in spec:
+            return self.value(spec, location)
+
+        if len(spec) != 1:
+            self.errors.append(f"{location}: requires either 'path', 'all', 'any' or 'not'")
+            return None
+
+        ((operator, operand),) = spec.items()
+        if operator == "not":
+            sub_condition = self.condition(operand, f"{location}.not")
+            return None if sub_condition is None else Neg(sub_condition)
+
+        if operator not in ("all", "any"):
+            self.errors.append(f"{location}: unknown combination {operator!r}")
+            return None
+        if not isinstance(operand, list):
+            self.errors.append(f"{location}.{operator}: requires a list of conditions")
+            return None
+
+        conditions = [
+            self.condition(sub, f"{location}.{operator}[{i}]") for i, sub in enumerate(operand)
+        ]
+        if any(sub is None for sub in conditions):
+            return None
+        return (And if operator == "all" else Or)(*conditions)  # type: ignore[arg-type]
+
+    def value(self, spec: Mapping[str, Any], location: str) -> Value | None:
+        if unknown := spec.keys() - _VALUE_KEYS:
+            self.errors.append(f"{location}: unknown keys {sorted(unknown)}")
+            return None
+
+        operator = spec.get("op")
+        if not isinstance(operator, str) or operator not in _OPERATORS:
+            self.errors.append(f"{location}.op: unknown operator {operator!r}")
+            return None
+
+        check_operand, build = _OPERATORS[operator]
+        operand = spec.get("value", _NO_OPERAND)
+        if (error := check_operand(operand)) is not None:
+            self.errors.append(f"{location}: operator {operator!r} {error}")
+            return None
+
+        path = spec["path"]
+        try:
+            value = Value(path) if isinstance(path, str) else None
+        except ValueError as exc:
+            self.errors.append(f"{location}.path: {exc}")
+            return None
+        if value is None:
+            self.errors.append(f"{location}.path: requires a string")
+            return None
+
+        return build(value, operand)
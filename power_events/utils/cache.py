@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe mapping of bounded size, evicting the least recently used entries."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: The maximum number of entries kept.
+        """
+        if max_size <= 0:
+            raise ValueError(f"Cache size should be positive, got {max_size}")
+
+        self.max_size = max_size
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> V | None:
+        """Get the value cached for the key, marking it as recently used.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Cache the value for the key, evicting the least recently used entry if full.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,5 +1,9 @@
 import asyncio
+import contextvars
+import sys
 from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from functools import partial
 from typing import TypeVar, cast
 
 from typing_extensions import ParamSpec
@@ -17,4 +21,25 @@ async def run_async(func: AnyFunc[P, T], *args: P.args, **kwargs: P.kwargs) -> T
     """Run a sync or async function, always returning a coroutine."""
     if asyncio.iscoroutinefunction(func):
         return await cast(AsyncFunc[P, T], func)(*args, **kwargs)
-    return await asyncio.to_thread(cast(SyncFunc[P, T], func), *args, **kwargs)
+    return await run_in_executor(None, cast(SyncFunc[P, T], func), *args, **kwargs)
+
+
+async def run_in_executor(
+    executor: Executor | None, func: SyncFunc[P, T], *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """Run a sync function inside the executor, or the loop default one, keeping the current context.
+
+    The context can't be sent to another process, it is not kept inside a process pool.
+    """
+    loop = asyncio.get_running_loop()
+    if _is_process_pool(executor):
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, partial(context.run, func, *args, **kwargs))
+
+
+def _is_process_pool(executor: Executor | None) -> bool:
+    """Whether the executor is a process pool, without importing them when none was created."""
+    process = sys.modules.get("concurrent.futures.process")
+    return process is not None and isinstance(executor, process.ProcessPoolExecutor)
@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+"""Benchmarks of the hot paths: path access, value checks, condition trees and resolution.
+
+Each case reports its throughput, the p50/p99 latency of an operation and the peak memory
+allocated while running it. Results can be saved as a baseline, then compared against.
+
+Usage:
+    python script/benchmark.py [--filter NAME] [--save PATH] [--compare PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, closing, contextmanager
+from dataclasses import asdict, dataclass
+from functools import cache, partial
+from operator import eq
+from pathlib import Path
+from typing import Any
+
+from power_events import EventResolver
+from power_events.conditions import And, Or, Value, ValuePath
+from power_events.resolver import logger
+from power_events.rules import load_rules
+
+# Minimal duration of a timed batch of operations, the latency of an operation is its average.
+BATCH_SECONDS = 1e-4
+BATCHES = 200
+
+
+@dataclass
+class Result:
+    """Measures of a benchmark case."""
+
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_kib: float
+
+
+@dataclass
+class Case:
+    """A benchmark case, an operation to repeat, only set up when run."""
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    batches: int = BATCHES
+
+    @classmethod
+    def of(cls, name: str, operation: Callable[[], Any], batches: int = BATCHES) -> "Case":
+        """A case whose operation needs no setup."""
+        return cls(name, lambda: operation, batches)
+
+
+def measure(operation: Callable[[], Any], batches: int = BATCHES) -> Result:
+    """Measure the operation, run by batches long enough to be timed precisely."""
+    operation()  # warm up, e.g. lazy compilation of the conditions
+
+    number = 1
+    while _time_batch(operation, number) < BATCH_SECONDS:
+        number *= 2
+
+    latencies = sorted(_time_batch(operation, number) / number for _ in range(batches))
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(
+        ops_per_sec=1 / statistics.fmean(latencies),
+        p50_us=latencies[len(latencies) // 2] * 1e6,
+        p99_us=latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1e6,
+        peak_kib=peak / 1024,
+    )
+
+
+def _time_batch(operation: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        operation()
+    return time.perf_counter() - start
+
+
+def _nested_event(depth: int) -> tuple[ValuePath, dict[str, Any]]:
+    keys = [f"k{i}" for i in range(depth)]
+    event: dict[str, Any] = {"value": 1}
+    for key in reversed(keys):
+        event = {key: event}
+    return ValuePath(".".join([*keys, "value"])), event
+
+
+def path_cases(_stack: ExitStack) -> Iterator[Case]:
+    """Access of values at various depths."""
+    for depth in (0, 2, 8):
+        path, event = _nested_event(depth)
+        yield Case.of(f"path.get_from[depth={depth + 1}]", partial(path.get_from, event))
+
+
+def value_cases(_stack: ExitStack) -> Iterator[Case]:
+    """Check of a value with each kind of predicate."""
+    event = {"a": "order_created", "items": [1, 2, 3], "n": 5}
+    values = {
+        "equals": Value("a").equals("order_created"),
+        "one_of": Value("a").one_of({"order_created", "order_updated"}),
+        "contains": Value("items").contains(2, 3),
+        "match_regex": Value("a").match_regex(r"^order_\w+$"),
+        "is_truthy": Value("a").is_truthy(),
+        "is_length": Value("items").is_length(3),
+        "match": Value("n").match(lambda n: n > 3),
+        "mapper": Value("n", str).equals("5"),
+    }
+    for kind, value in values.items():
+        yield Case.of(f"value.check[{kind}]", partial(value.check, event))
+
+    # Few items are searched linearly, stopping early, many through a set of the list.
+    large = {"items": list(range(10_000))}
+    for items in (2, 16):
+        value = Value("items").contains(*range(items))
+        yield Case.of(
+            f"value.check[contains,items={items},length=10000]", partial(value.check, large)
+        )
+
+
+def tree_cases(_stack: ExitStack) -> Iterator[Case]:
+    """Check of `And`/`Or` trees of varying width, evaluating all their sub-conditions."""
+    event = {f"k{i}": i for i in range(32)}
+    for width in (2, 8, 32):
+        all_pass = And(*(Value(f"k{i}").equals(i) for i in range(width)))
+        last_pass = Or(
+            *(Value(f"k{i}").equals(-1) for i in range(width - 1)), Value("k0").equals(0)
+        )
+        yield Case.of(f"and.check[width={width}]", partial(all_pass.check, event))
+        yield Case.of(f"or.check[width={width}]", partial(last_pass.check, event))
+
+
+def _resolver(stack: ExitStack, routes: int, *, indexed: bool = True) -> EventResolver:
+    app = stack.enter_context(EventResolver(reuse_loop=True, inline_single_route=True))
+    for i in range(routes):
+        condition = Value("type").equals(i) if indexed else Value("type").match(partial(eq, i))
+        app.when(condition)(lambda event: event)
+    return app
+
+
+def resolve_cases(stack: ExitStack) -> Iterator[Case]:
+    """Resolution of events by various resolvers."""
+
+    def resolve(routes: int, indexed: bool = True) -> Callable[[], Any]:
+        return partial(_resolver(stack, routes, indexed=indexed).resolve, {"type": routes - 1})
+
+    for routes in (1, 100, 10_000):
+        yield Case(f"resolve[routes={routes}]", partial(resolve, routes))
+    yield Case("resolve[routes=100,unindexed]", partial(resolve, 100, indexed=False))
+
+    def resolve_on_new_loop() -> Callable[[], Any]:
+        app = stack.enter_context(EventResolver())
+        app.equal("type", 0)(lambda event: event)
+        return partial(app.resolve, {"type": 0})
+
+    yield Case("resolve[new_loop]", resolve_on_new_loop)
+
+
+def handler_cases(stack: ExitStack) -> Iterator[Case]:
+    """Resolution by synchronous and asynchronous route functions."""
+
+    @cache
+    def resolver() -> EventResolver:
+        app = stack.enter_context(EventResolver(reuse_loop=True))
+
+        @app.equal("type", "blocking")
+        def blocking(event: Any) -> Any:
+            return event
+
+        @app.equal("type", "inline", blocking=False)
+        def inline(event: Any) -> Any:
+            return event
+
+        @app.equal("type", "async")
+        async def coroutine(event: Any) -> Any:
+            return event
+
+        return app
+
+    def resolve(kind: str) -> Callable[[], Any]:
+        return partial(resolver().resolve, {"type": kind})
+
+    for kind in ("blocking", "inline", "async"):
+        yield Case(f"resolve[handler={kind}]", partial(resolve, kind))
+
+    def resolve_async() -> Callable[[], Any]:
+        app = resolver()
+        loop = stack.enter_context(closing(asyncio.new_event_loop()))
+        return lambda: loop.run_until_complete(app.resolve_async({"type": "async"}))
+
+    yield Case("resolve_async[handler=async]", resolve_async)
+
+
+def error_cases(stack: ExitStack) -> Iterator[Case]:
+    """Resolution through the fallback route and the exception handlers."""
+
+    @cache
+    def resolver() -> EventResolver:
+        app = stack.enter_context(EventResolver(reuse_loop=True, inline_single_route=True))
+
+        @app.equal("type", "error")
+        def fail(event: Any) -> Any:
+            raise ValueError(event)
+
+        @app.fallback
+        def fallback(event: Any) -> Any:
+            return event
+
+        @app.exception_handler(ValueError)
+        def handle(exc: ValueError) -> str:
+            return str(exc)
+
+        return app
+
+    def resolve(kind: str) -> Callable[[], Any]:
+        return partial(resolver().resolve, {"type": kind})
+
+    yield Case("resolve[fallback]", partial(resolve, "unknown"))
+    yield Case("resolve[exception_handler]", partial(resolve, "error"))
+
+
+def _rule_set(rules: int) -> dict[str, Any]:
+    return {
+        "routes": [
+            {
+                "handler": "handle",
+                "when": {
+                    "all": [
+                        {"path": "detail.type", "op": "equals", "value": f"type_{i}"},
+                        {"path": "detail.source", "op": "one_of", "value": ["api", "batch"]},
+                        {"not": {"path": "detail.test", "op": "is_truthy"}},
+                    ]
+                },
+            }
+            for i in range(rules)
+        ]
+    }
+
+
+def rule_cases(_stack: ExitStack) -> Iterator[Case]:
+    """Startup of resolvers from declarative rule sets: loading, then freezing the routes."""
+    handlers = {"handle": lambda event: event}
+
+    def startup(rules: int) -> Callable[[], Any]:
+        rule_set = _rule_set(rules)
+
+        def operation() -> None:
+            app = EventResolver()
+            load_rules(app, rule_set, handlers)
+            app.freeze()
+
+        return operation
+
+    for rules in (100, 10_000):
+        yield Case(
+            f"load_rules[rules={rules}]",
+            partial(startup, rules),
+            batches=5 if rules > 100 else BATCHES,
+        )
+
+
+def import_cases(_stack: ExitStack) -> Iterator[Case]:
+    """Import of the package by a new interpreter, its startup included.
+
+    Details by module are given by `python -X importtime -c "import power_events"`.
+    """
+    for name, statement in (
+        ("power_events", "import power_events"),
+        ("EventResolver", "from power_events import EventResolver"),
+    ):
+        command = [sys.executable, "-c", statement]
+        yield Case.of(f"import[{name}]", partial(subprocess.run, command, check=True), batches=20)
+
+
+SUITES = (
+    path_cases,
+    value_cases,
+    tree_cases,
+    resolve_cases,
+    handler_cases,
+    error_cases,
+    rule_cases,
+    import_cases,
+)
+
+
+@contextmanager
+def _silenced_resolver_logs() -> Iterator[None]:
+    disabled = logger.disabled
+    logger.disabled = True
+    try:
+        yield
+    finally:
+        logger.disabled = disabled
+
+
+def run(pattern: str | None) -> dict[str, Result]:
+    """Run the benchmark cases, whose name matches the pattern if given.
+
+    Only the selected cases are set up, the resources of a suite are closed once it is run.
+    """
+    results: dict[str, Result] = {}
+    with _silenced_resolver_logs():
+        for suite in SUITES:
+            with ExitStack() as stack:
+                for case in suite(stack):
+                    if pattern and not re.search(pattern, case.name):
+                        continue
+                    results[case.name] = result = measure(case.setup(), case.batches)
+                    print(
+                        f"{case.name:<34} {result.ops_per_sec:>14,.0f} ops/s"
+                        f" p50 {result.p50_us:>10.2f}µs p99 {result.p99_us:>10.2f}µs"
+                        f" peak {result.peak_kib:>9.1f}KiB"
+                    )
+    return results
+
+
+def compare(results: dict[str, Result], baseline: dict[str, Any], tolerance: float) -> bool:
+    """Compare the median latency of the cases to the baseline, less sensitive to noise.
+
+    Returns:
+        Whether no case is slower than the baseline beyond the tolerance.
+    """
+    ok = True
+    print(f"\nComparison to baseline ({baseline['python']}, {baseline['machine']}):")
+    for name, result in results.items():
+        if name not in baseline["results"]:
+            continue
+        ratio = baseline["results"][name]["p50_us"] / result.p50_us
+        regressed = ratio < 1 - tolerance
+        ok = ok and not regressed
+        print(f"{name:<34} {ratio:>6.2f}x{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main() -> int:
+    """Run the benchmarks, from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="regex selecting the cases to run, by name")
+    parser.add_argument("--save", type=Path, help="save the results as JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare the results to a JSON baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="accepted slowdown compared to the baseline (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    results = run(args.filter)
+
+    if args.save:
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": {name: asdict(result) for name, result in results.items()},
+        }
+        args.save.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        return 0 if compare(results, baseline, args.tolerance) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
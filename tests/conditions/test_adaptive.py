@@ -0,0 +1,84 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from power_events.conditions import And, Or, Value
+from power_events.conditions.adaptive import AdaptiveCheck
+from power_events.conditions.value import CachedEvent
+
+
+class IsPlainDict(And):
+    def check(self, event: Any) -> bool:
+        return type(event) is dict
+
+
+def slow_truthy(val: Any) -> bool:
+    time.sleep(0.001)
+    return bool(val)
+
+
+class TestAdaptiveCheck:
+    def test_should_put_cheap_and_selective_sub_conditions_first(self) -> None:
+        slow_a, slow_c = Value("a").match(slow_truthy), Value("c").match(slow_truthy)
+        cheap = Value("b").equals(1)
+        check = AdaptiveCheck(slow_a & (slow_c | cheap), sample_every=1, reorder_every=4)
+
+        for event in [{"a": 1, "b": 0}, {"a": 1, "b": 1}, {"a": 1, "b": 2}, {"a": 1, "b": 3}]:
+            assert check(event) == check.condition.check(event)
+
+        assert isinstance(check.condition, And)
+        first, second = check.condition.conditions
+        assert isinstance(first, Or)
+        assert first.conditions == (cheap, slow_c)
+        assert second is slow_a
+
+    def test_should_keep_results_when_reordered(self) -> None:
+        condition = (Value("a").is_truthy() | Value("b").equals(1)) & Value("c").one_of([1, 2])
+        check = AdaptiveCheck(condition, sample_every=2, reorder_every=2)
+        events = [{"a": i % 2, "b": i % 3, "c": i % 4} for i in range(40)]
+
+        assert [check(event) for event in events] == [condition.check(event) for event in events]
+
+    def test_should_check_custom_conditions_on_original_event(self) -> None:
+        check = AdaptiveCheck(Value("a").equals(1) & IsPlainDict(), sample_every=1)
+        event = CachedEvent({"a": 1}, {"a"})
+
+        assert check(event)  # sampled
+        assert check._check(event)
+
+    def test_should_freeze_order_when_evaluating_all_raises(self) -> None:
+        condition = Value("a").is_truthy() & Value("a").match(lambda val: val > 0)
+        check = AdaptiveCheck(condition, sample_every=1, reorder_every=1)
+
+        assert not check({"a": None})
+        assert check.condition is condition
+        with pytest.raises(TypeError):
+            check({"a": "1"})
+
+    def test_should_freeze_order_when_reordering_raises(self, monkeypatch: Any) -> None:
+        condition = Value("a").is_truthy() | Value("b").is_truthy()
+        check = AdaptiveCheck(condition, sample_every=1, reorder_every=1)
+        monkeypatch.setattr(check, "_reorder", Mock(side_effect=KeyError))
+
+        assert check({"b": 1})
+        assert check.condition is condition
+        assert check({"a": 1})
+        check._reorder.assert_called_once()  # type: ignore[attr-defined]
+
+    def test_should_check_from_threads(self) -> None:
+        condition = (Value("a").is_truthy() | Value("b").equals(1)) & (
+            Value("c").one_of([1, 2]) | Value("d").is_falsy()
+        )
+        check = AdaptiveCheck(condition, sample_every=1, reorder_every=1)
+        events = [{"a": i % 2, "b": i % 3, "c": i % 4, "d": i % 5} for i in range(2000)]
+        expected = [condition.check(event) for event in events]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = [
+                executor.submit(lambda: [check(event) for event in events]) for _ in range(8)
+            ]
+
+        assert all(result.result() == expected for result in results)
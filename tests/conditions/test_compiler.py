@@ -0,0 +1,141 @@
+import os
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from power_events.conditions import And, Condition, Or, Value, compile_condition
+from power_events.conditions.compiler import CodeCache
+from power_events.conditions.value import ABSENT, CachedEvent
+from power_events.exceptions import NoPredicateError
+
+
+class IsDict(Condition):
+    def check(self, event: Any) -> bool:
+        return isinstance(event.get("d"), dict)
+
+    def __or__(self, other: Condition) -> Condition:
+        return Or(self, other)
+
+    def __and__(self, other: Condition) -> Condition:
+        return And(self, other)
+
+    def __invert__(self) -> Condition:
+        raise NotImplementedError
+
+
+class IsPlainDict(IsDict):
+    def check(self, event: Any) -> bool:
+        return type(event) is dict
+
+
+class MyAnd(And):
+    pass
+
+
+class OptionalValue(Value):
+    def check(self, event: Any, *, raise_if_absent: bool = False) -> bool:
+        absent = self.path.get_from(event) is ABSENT
+        return absent or super().check(event, raise_if_absent=raise_if_absent)
+
+
+class Xor(Or):
+    def check(self, event: Any) -> bool:
+        return sum(condition.check(event) for condition in self.conditions) == 1
+
+
+EVENTS: list[dict[str, Any]] = [
+    {},
+    {"a": 1, "b": "x", "c": [1, 2]},
+    {"a": 2, "b": "y", "c": [], "d": {}},
+    {"a": {"b": 1}, "b": None, "d": {"e": "2021-01-01"}},
+]
+
+CONDITIONS: list[Condition] = [
+    Value("a").equals(1),
+    Value("a").equals(1) & Value("b").one_of(["x", "y"]),
+    (Value("a").equals(2) | Value("c").contains(1)) & ~Value("b").equals("y"),
+    Value("c").is_not_empty().is_length(2) | Value("a.b").is_truthy(),
+    ~(Value("a").equals(1) & (Value("b").equals("x") & Value("c").is_length(2))),
+    Value("d.e", lambda val: val[:4]).equals("2021") | IsDict(),
+    Value.root().contains("d"),
+    And(),
+    Or(),
+    MyAnd(Value("a").equals(1), Value("b").equals("x")),
+    MyAnd(),
+    Xor(Value("a").equals(1), Value("b").one_of(["x", "y"])) & Value("b").is_truthy(),
+    OptionalValue("a").equals(1) | OptionalValue("x").equals(1),
+    Value("a").equals(1) & IsPlainDict(),
+    Xor(IsPlainDict(), Value("b").equals("x")),
+]
+
+
+@pytest.mark.parametrize("condition", CONDITIONS)
+@pytest.mark.parametrize("event", EVENTS)
+def test_compiled_condition_should_check_like_condition(
+    condition: Condition, event: dict[str, Any]
+) -> None:
+    compiled = compile_condition(condition)
+
+    assert compiled(event) is condition.check(event)
+    assert compiled(CachedEvent(event, {"a", "b"})) is condition.check(event)
+
+
+def test_compiled_condition_should_raise_error_when_no_predicate_set() -> None:
+    compiled = compile_condition(Value("a").equals(1) | Value("b"))
+
+    assert compiled({"a": 1})
+    with pytest.raises(NoPredicateError):
+        compiled({"a": 2})
+
+
+def test_compiled_conditions_of_same_shape_should_share_code() -> None:
+    first = compile_condition(Value("a").equals(1) & Value("b").is_truthy())
+    second = compile_condition(Value("c").equals(2) & Value("d").is_truthy())
+
+    assert first.__code__ is second.__code__
+    assert first({"a": 1, "b": True})
+    assert not second({"a": 1, "b": True})
+
+
+def test_code_cache_should_be_saved_and_loaded(tmp_path: Path) -> None:
+    path = tmp_path / "codes"
+    cache = CodeCache()
+    code = cache.get("def check(event):\n    return True\n", "<test>")
+    assert cache.modified
+
+    cache.save(path)
+    assert not cache.modified
+
+    loaded = CodeCache()
+    assert loaded.load(path)
+    assert loaded.get("def check(event):\n    return True\n", "<test>") == code
+    assert not loaded.modified
+
+
+@pytest.mark.parametrize("content", [b"", b"invalid", MAGIC_NUMBER + b"invalid"])
+def test_code_cache_should_ignore_invalid_file(tmp_path: Path, content: bytes) -> None:
+    path = tmp_path / "codes"
+    path.write_bytes(content)
+    cache = CodeCache()
+
+    assert not cache.load(path)
+    assert not cache.load(tmp_path / "missing")
+    assert len(cache) == 0
+
+
+def test_code_cache_should_ignore_file_writable_by_others(tmp_path: Path, monkeypatch: Any) -> None:
+    path = tmp_path / "codes"
+    cache = CodeCache()
+    cache.get("def check(event):\n    return True\n", "<test>")
+    cache.save(path)
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    path.chmod(0o620)
+    assert not CodeCache().load(path)
+    path.chmod(0o600)
+    assert CodeCache().load(path)
+
+    monkeypatch.setattr(os, "getuid", lambda: path.stat().st_uid + 1, raising=False)
+    assert not CodeCache().load(path)
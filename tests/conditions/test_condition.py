@@ -1,6 +1,7 @@
 from power_events.conditions.condition import (
     And,
     Or,
+    leaves,
 )
 from power_events.conditions.value import Value
 
@@ -60,3 +61,9 @@ class TestCondition:
         assert condition.check({"a": {"b": 0, "c": "maypy"}})
         assert condition.check({"a": {"b": 1, "c": "power-events"}})
         assert not condition.check({"a": {"b": 1, "c": "maypy"}})
+
+    def test_leaves(self) -> None:
+        a, b, c = Value("a").equals(1), Value("b").equals(1), Value("c").equals(1)
+
+        assert list(leaves(a)) == [a]
+        assert list(leaves(a & (b | c))) == [a, b, c]
@@ -0,0 +1,76 @@
+from typing import Any
+
+import pytest
+
+from power_events.conditions import And, Condition, Or, Value, normalize
+
+
+def structure(condition: Condition) -> Any:
+    if isinstance(condition, (And, Or)):
+        return type(condition).__name__, [structure(sub) for sub in condition.conditions]
+    if isinstance(condition, Value):
+        return condition.path, condition.expected_values
+    return condition
+
+
+class OptionalValue(Value):
+    def check(self, event: Any, *, raise_if_absent: bool = False) -> bool:
+        return "x" not in event or super().check(event, raise_if_absent=raise_if_absent)
+
+
+a, b, c = Value("a").is_truthy(), Value("b").is_truthy(), Value("c").is_truthy()
+
+
+class TestNormalize:
+    def test_should_flatten_nested_expressions_of_same_operator(self) -> None:
+        normalized = normalize(((a & b) & c) | (a | (b | c)) & a)
+
+        assert isinstance(normalized, Or)
+        assert normalized.conditions[0].conditions == (a, b, c)  # type: ignore[attr-defined]
+
+    def test_should_remove_duplicates(self) -> None:
+        assert normalize(a & b & a).conditions == (a, b)  # type: ignore[attr-defined]
+        assert normalize(Value("x").equals(1) | Value("x").equals(1)).expected_values == {1}  # type: ignore[attr-defined]
+        assert normalize((a | b) & (a | b)).conditions == (a, b)  # type: ignore[attr-defined]
+
+    def test_should_simplify_constants(self) -> None:
+        assert normalize(a & And()) is a
+        assert structure(normalize(a & Or())) == ("Or", [])
+        assert normalize(a | Or()) is a
+        assert structure(normalize(a | And() | b)) == ("And", [])
+
+    def test_should_merge_expected_values_on_same_path(self) -> None:
+        assert structure(
+            normalize(Value("x").equals(1) | a | Value("x").one_of([2, 3]) | Value("y").equals(1))
+        ) == ("Or", [("x", {1, 2, 3}), ("a", None), ("y", {1})])
+        assert structure(normalize(Value("x").one_of([1, 2]) & Value("x").one_of([2, 3]))) == (
+            "x",
+            {2},
+        )
+        assert structure(normalize(Value("x").equals(1) & Value("x").equals(2) & a)) == ("Or", [])
+
+    def test_should_keep_conditions_not_only_checking_expected_values(self) -> None:
+        mapped = Value("x", str).equals("1")
+        both = Value("x").one_of([1, 2]).is_truthy()
+        normalized = normalize(Value("x").equals(1) | mapped | both)
+
+        assert normalized.conditions[1:] == (mapped, both)  # type: ignore[attr-defined]
+
+    def test_should_not_merge_nor_deduplicate_value_subclasses(self) -> None:
+        optional = OptionalValue("x").equals(1)
+        normalized = normalize(Value("x").equals(1) | optional | Value("x").equals(2))
+
+        assert normalized.conditions[1] is optional  # type: ignore[attr-defined]
+        assert normalized.check({})
+        assert normalize(Value("x").equals(1) & optional).conditions[1] is optional  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize(
+        "event", [{}, {"x": 1, "a": 1}, {"x": 2, "b": 0}, {"x": [1], "c": 1}, {"x": 3, "b": 1}]
+    )
+    def test_normalized_condition_should_check_like_condition(self, event: dict[str, Any]) -> None:
+        condition = (
+            (Value("x").equals(1) | Value("x").one_of([2, 3]) | (a & And() & b))
+            & (c | Or() | Value("x").equals(3))
+        ) | (Value("x").equals(1) & Value("x").equals(2))
+
+        assert normalize(condition).check(event) == condition.check(event)
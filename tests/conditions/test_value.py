@@ -1,10 +1,12 @@
+import pickle
 from datetime import datetime
+from typing import Any
 
 import pytest
-from maypy.predicates import contains, is_length
+from maypy.predicates import contains, is_empty, is_length, neg
 
 from power_events.conditions import Neg
-from power_events.conditions.value import ABSENT, Value, ValuePath, combine
+from power_events.conditions.value import ABSENT, CachedEvent, Value, ValuePath, combine
 from power_events.exceptions import NoPredicateError, ValueAbsentError
 
 
@@ -17,6 +19,13 @@ def test_combine() -> None:
 
 
 class TestValuePath:
+    def test_parsed_paths_should_be_bounded(self) -> None:
+        for i in range(5000):
+            assert ValuePath(f"items.{i}").keys == ["items", str(i)]
+
+        assert ValuePath._parse.cache_info().currsize == ValuePath._parse.cache_info().maxsize
+        assert ValuePath("items.1").get_from({"items": {"1": "a"}}) == "a"
+
     def test_should_raise_error_when_path_begin_by_sep(self) -> None:
         with pytest.raises(ValueError, match="Path value should not begin"):
             ValuePath(".a.b")
@@ -60,6 +69,21 @@ class TestValuePath:
         assert path.get_from({}, None) is None
         assert path.get_from({"a": 1}, None) is None
 
+    def test_get_should_not_copy_mapping(self) -> None:
+        event = {"a": {"b": 2}}
+        assert ValuePath("").get_from(event) is event
+
+    def test_get_should_ignore_non_mapping_values(self) -> None:
+        assert ValuePath("a.0").get_from({"a": ["first"]}) is ABSENT
+        assert ValuePath("a.²").get_from({"a": {"²": 2}}) == 2
+
+    def test_should_be_picklable(self) -> None:
+        path = pickle.loads(pickle.dumps(ValuePath("a/1", separator="/")))  # noqa: S301
+
+        assert path == "a/1"
+        assert path.separator == "/"
+        assert path.get_from({"a": {1: "int"}}) == "int"
+
     def test_get_should_raise_error_when_no_value_and_flag_set(self) -> None:
         with pytest.raises(ValueAbsentError) as excinfo:
             ValuePath("foo.bar").get_from({"foo": {}}, raise_if_absent=True)
@@ -67,6 +91,37 @@ class TestValuePath:
         assert excinfo.value.path == "foo.bar"
 
 
+class TestCachedEvent:
+    def test_should_extract_shared_path_only_once(self) -> None:
+        event: dict[str, Any] = {"a": {"b": 1}, "c": 1}
+        view = CachedEvent(event, {"a.b"})
+
+        assert ValuePath("a.b").get_from(view) == 1
+        assert ValuePath("c").get_from(view) == 1
+        event["a"]["b"] = event["c"] = 2
+        assert ValuePath("a.b").get_from(view) == 1
+        assert ValuePath("c").get_from(view) == 2
+
+    def test_should_be_a_view_of_the_event(self) -> None:
+        event = {"a": {"b": 1}}
+        view = CachedEvent(event, {"a"})
+
+        assert view == event
+        assert len(view) == 1
+        assert list(view) == ["a"]
+        assert repr(view) == repr(event)
+        assert ValuePath("").get_from(view) is event
+
+    def test_should_raise_error_with_event_when_value_absent_and_flag_set(self) -> None:
+        event: dict[str, Any] = {"a": {}}
+
+        with pytest.raises(ValueAbsentError) as excinfo:
+            Value("a.b").equals(1).check(CachedEvent(event, {"a.b"}), raise_if_absent=True)
+
+        assert excinfo.value.missing_key == "b"
+        assert not Value("a.b").equals(1).check(CachedEvent(event, {"a.b"}))
+
+
 class TestValue:
     def test_root(self) -> None:
         assert Value.root().contains("a").check({"a": 1})
@@ -85,6 +140,19 @@ class TestValue:
     def test_contains(self) -> None:
         assert Value("a.b").contains(1, 2).check({"a": {"b": [1, 2]}})
 
+    @pytest.mark.parametrize("items", [2, 10])
+    @pytest.mark.parametrize("length", [10, 100])
+    def test_contains_in_list(self, length: int, items: int) -> None:
+        value = Value("a").contains(*range(items - 1), length - 1)
+
+        assert value.check({"a": list(range(length))})
+        assert value.check({"a": [*range(length), [0]]})
+        assert not value.check({"a": list(range(1, length))})
+
+    def test_contains_should_require_items(self) -> None:
+        with pytest.raises(ValueError, match="At least one item"):
+            Value("a").contains()
+
     def test_is_not_empty(self) -> None:
         assert Value("a.b").is_not_empty().check({"a": {"b": "not empty"}})
         assert not Value("a.b").is_not_empty().check({"a": {"b": []}})
@@ -97,6 +165,11 @@ class TestValue:
         assert Value("a.b").one_of(["foo", "bar"]).check({"a": {"b": "bar"}})
         assert not Value("a.b").one_of(["foo", "bar"]).check({"a": {"b": "baz"}})
 
+    def test_one_of_unhashable_value(self) -> None:
+        assert not Value("a").one_of(["foo", "bar"]).check({"a": ["foo"]})
+        assert Value("a").one_of([("x",), ["x"]]).check({"a": ["x"]})
+        assert Value("a").one_of("xy").check({"a": "x"})
+
     def test_match_regex(self) -> None:
         assert Value("a.b").match_regex(r"test_\d{2,}").check({"a": {"b": "test_123"}})
         assert not Value("a.b").match_regex(r"test_\d{2,}").check({"a": {"b": "test"}})
@@ -146,3 +219,21 @@ class TestValue:
         value.mapper = lambda val: datetime.strptime(val, "%Y-%m-%d")
 
         assert value.check({"a": "2021-02-08"})
+
+    def test_expected_values(self) -> None:
+        assert Value("a").equals(1).expected_values == frozenset({1})
+        assert Value("a").one_of(["x", "y"]).equals("y").expected_values == frozenset({"y"})
+        assert Value("a").one_of("xy").expected_values is None
+        assert Value("a").one_of([["x"]]).expected_values is None
+        assert Value("a", str.upper).equals("X").expected_values is None
+        assert Value("a").is_truthy().expected_values is None
+
+    def test_is_pure(self) -> None:
+        assert Value("a").equals(1).is_truthy().is_pure
+        assert Value("a").match(neg(is_empty)).is_pure
+        assert not Value("a").is_pure
+        assert not Value("a").match(lambda val: val > 0).is_pure
+        assert not Value("a", str).equals("1").is_pure
+        assert Value("a").one_of(["t1", "t2"]).is_pure
+        assert not Value("a").one_of({"t1": True}).is_pure
+        assert not Value("a").equals(["t1"]).is_pure
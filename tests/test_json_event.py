@@ -0,0 +1,115 @@
+import json
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from power_events.json_event import JsonEvent
+
+DOCUMENT = {
+    "type": "order_created",
+    "detail": {"id": 1, "tags": ["a", "}"], "customer": {"name": 'say "hi"'}},
+    "items": [{"sku": "s1"}, {"sku": "s2"}],
+    "empty": {},
+    "price": 1.5e2,
+    "paid": True,
+    "note": None,
+    "text": "café \\ \n",
+}
+RAW = json.dumps(DOCUMENT, indent=2).encode()
+
+
+class TestJsonEvent:
+    @pytest.mark.parametrize("raw", [RAW, bytearray(RAW), memoryview(RAW), RAW.decode()])
+    def test_should_be_equal_to_decoded_document(self, raw: Any) -> None:
+        event = JsonEvent(raw)
+
+        assert event == DOCUMENT
+        assert event.decode() == DOCUMENT
+        assert list(event) == list(DOCUMENT)
+        assert len(event) == len(DOCUMENT)
+
+    def test_should_only_decode_members_up_to_requested_key(self) -> None:
+        event = JsonEvent(b'{"type": "a", "detail": {"id": 1, "x": 2}, "payload": invalid')
+
+        assert event["type"] == "a"
+        assert event["detail"]["id"] == 1
+        assert "type" in event
+        with pytest.raises(json.JSONDecodeError):
+            event["payload"]
+
+    def test_nested_object_should_be_lazy_view(self) -> None:
+        event = JsonEvent(RAW)
+
+        detail = event["detail"]
+
+        assert isinstance(detail, JsonEvent)
+        assert detail["customer"] == {"name": 'say "hi"'}
+        assert event["items"] == DOCUMENT["items"]
+
+    def test_missing_key(self) -> None:
+        event = JsonEvent(RAW)
+
+        assert "missing" not in event
+        assert event.get("missing") is None
+        with pytest.raises(KeyError):
+            event["missing"]
+
+    def test_should_keep_first_member_of_duplicate_keys(self) -> None:
+        assert JsonEvent(b'{"a": 1, "a": 2}')["a"] == 1
+
+    def test_empty_object(self) -> None:
+        assert JsonEvent(b" { } ") == {}
+
+    def test_should_raise_error_when_trailing_comma_after_requested_key(self) -> None:
+        event = JsonEvent(b'{"a": 1,}')
+
+        assert event["a"] == 1
+        with pytest.raises(json.JSONDecodeError, match="Expecting property name"):
+            len(event)
+
+    def test_should_decode_members_read_from_threads(self) -> None:
+        document = {f"k{i}": {"v": i, "w": [i]} for i in range(300)}
+        raw = json.dumps(document).encode()
+
+        for _ in range(20):
+            event = JsonEvent(raw)
+            barrier = threading.Barrier(4)
+
+            def read(step: int, event: JsonEvent = event, barrier: Any = barrier) -> list[Any]:
+                barrier.wait()
+                return [event[f"k{i}"]["w"] for i in range(0, 300, step)]
+
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(read, [1, 2, 3, 5]))
+
+            assert results == [[[i] for i in range(0, 300, step)] for step in [1, 2, 3, 5]]
+            assert event == document
+
+    def test_pickle(self) -> None:
+        event = JsonEvent(RAW)
+        assert isinstance(event["detail"], JsonEvent)
+
+        unpickled = pickle.loads(pickle.dumps(event))  # noqa: S301
+
+        assert isinstance(unpickled, JsonEvent)
+        assert unpickled == DOCUMENT
+
+    def test_repr(self) -> None:
+        assert repr(JsonEvent(b' {"a": {"b": [1]}} ')["a"]) == 'JsonEvent({"b": [1]})'
+
+    @pytest.mark.parametrize(
+        ("raw", "message"),
+        [
+            (b"[1, 2]", "Expecting JSON object"),
+            (b'{"a" 1}', "Expecting ':' delimiter"),
+            (b'{"a": 1 "b": 2}', "Expecting ',' delimiter"),
+            (b'{"a": 1,}', "Expecting property name"),
+            (b'{"a": 1', "Unterminated object"),
+        ],
+    )
+    def test_should_raise_error_when_invalid(self, raw: bytes, message: str) -> None:
+        with pytest.raises(json.JSONDecodeError, match=message):
+            len(JsonEvent(raw))
@@ -0,0 +1,64 @@
+from power_events.metrics import Histogram, InMemoryMetrics
+
+
+class TestHistogram:
+    def test_observe(self) -> None:
+        histogram = Histogram((0.1, 1.0))
+
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(2.0)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.total == 2.65
+
+
+class TestInMemoryMetrics:
+    def test_record(self) -> None:
+        metrics = InMemoryMetrics()
+
+        metrics.observe_check("route", 100, matched=True)
+        metrics.observe_check("route", 300, matched=False)
+        metrics.observe_execution("route", 2_000_000)
+        metrics.count_fallback("fallback")
+        metrics.count_exception_handled(ValueError, "handler")
+
+        assert metrics.checks["route"].checks == 2
+        assert metrics.checks["route"].matches == 1
+        assert metrics.checks["route"].time_ns == 400
+        assert metrics.executions["route"].count == 1
+        assert metrics.fallbacks == {"fallback": 1}
+        assert metrics.exceptions_handled == {("ValueError", "handler"): 1}
+
+    def test_reset(self) -> None:
+        metrics = InMemoryMetrics()
+        metrics.observe_check("route", 100, matched=True)
+        metrics.count_fallback("fallback")
+
+        metrics.reset()
+
+        assert not metrics.checks
+        assert not metrics.fallbacks
+
+    def test_to_prometheus(self) -> None:
+        metrics = InMemoryMetrics(buckets=(0.001, 0.01))
+        metrics.observe_check("route", 500_000_000, matched=True)
+        metrics.observe_execution("route", 5_000_000)
+        metrics.count_exception_handled(ValueError, 'say "hi"\\')
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE power_events_condition_checks_total counter\n" in text
+        assert 'power_events_condition_checks_total{route="route"} 1\n' in text
+        assert 'power_events_condition_check_seconds_total{route="route"} 0.5\n' in text
+        assert "# TYPE power_events_route_duration_seconds histogram\n" in text
+        assert 'power_events_route_duration_seconds_bucket{route="route",le="0.001"} 0\n' in text
+        assert 'power_events_route_duration_seconds_bucket{route="route",le="0.01"} 1\n' in text
+        assert 'power_events_route_duration_seconds_bucket{route="route",le="+Inf"} 1\n' in text
+        assert 'power_events_route_duration_seconds_count{route="route"} 1\n' in text
+        assert (
+            'power_events_exceptions_handled_total{exception="ValueError",handler="say \\"hi\\"\\\\"} 1\n'
+            in text
+        )
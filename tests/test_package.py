@@ -1,5 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
 import power_events
 
 
 def test_package() -> None:
     assert power_events.__version__
+
+
+def test_package_import_should_be_lazy() -> None:
+    heavy_modules = ["asyncio", "maypy", "importlib.metadata", "power_events.conditions.value"]
+    script = (
+        "import sys, power_events\n"
+        f"print(*[module for module in {heavy_modules} if module in sys.modules])\n"
+        "power_events.EventResolver\n"
+        "print('power_events.resolver' in sys.modules)\n"
+        "print(power_events.exceptions.__name__, power_events.conditions.value.__name__)\n"
+    )
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.splitlines() == [
+        "",
+        "True",
+        "power_events.exceptions power_events.conditions.value",
+    ]
+
+
+def test_package_should_raise_attribute_error_when_unknown() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        power_events.unknown  # noqa: B018
+    with pytest.raises(AttributeError, match="has no attribute '__wrapped__'"):
+        power_events.conditions.__wrapped__  # noqa: B018
@@ -0,0 +1,66 @@
+from typing import Any
+
+import pytest
+
+from power_events.conditions import Condition, Or, Value
+from power_events.prefilter import LiteralPrefilter
+
+
+class OptionalValue(Value):
+    def check(self, event: Any, *, raise_if_absent: bool = False) -> bool:
+        return "type" not in event or super().check(event, raise_if_absent=raise_if_absent)
+
+
+class TestLiteralPrefilter:
+    @pytest.mark.parametrize(
+        ("condition", "literals"),
+        [
+            (Value("type").equals("created"), {"created"}),
+            (Value("type").one_of(["created", "deleted"]), {"created", "deleted"}),
+            (Value("tags").contains("a", "urgent"), {"urgent"}),
+            (Value("type").equals("created") & Value("n").equals(1), {"created"}),
+            (Value("a").one_of(["x", "y"]) & Value("b").equals("long"), {"long"}),
+            (Value("a").equals("x") | Value("b").equals("y"), {"x", "y"}),
+            (Or(), set()),
+        ],
+    )
+    def test_from_conditions(self, condition: Condition, literals: set[str]) -> None:
+        prefilter = LiteralPrefilter.from_conditions([condition])
+
+        assert prefilter is not None
+        assert prefilter.literals == literals
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            Value("n").equals(1),
+            Value("type").match(lambda val: val == "created"),
+            Value("type", str.lower).equals("created"),
+            ~Value("type").equals("created"),
+            Value("a").equals("x") | Value("n").equals(1),
+            Value("tags").contains(1),
+            OptionalValue("type").equals("created"),
+        ],
+    )
+    def test_from_conditions_should_be_none_when_literals_not_required(
+        self, condition: Condition
+    ) -> None:
+        assert LiteralPrefilter.from_conditions([Value("a").equals("x"), condition]) is None
+
+    @pytest.mark.parametrize("size", [2, 100])
+    def test_may_match(self, size: int) -> None:
+        literals = [f"type_{i}" for i in range(size)] + ["é", "type_"]
+        prefilter = LiteralPrefilter(literals)
+
+        assert prefilter.may_match(b'{"type": "type_1"}')
+        assert prefilter.may_match(bytearray('{"type": "é"}'.encode()))
+        assert prefilter.may_match(memoryview(b'{"a": "type_"}'))
+        assert not prefilter.may_match(b'{"type": "other"}')
+
+    def test_may_match_when_escaped_payload(self) -> None:
+        prefilter = LiteralPrefilter(["a"])
+
+        assert prefilter.may_match(b'{"type": "\\u0061"}')
+
+    def test_may_match_when_empty_literal(self) -> None:
+        assert LiteralPrefilter([""]).may_match(b"{}")
@@ -1,13 +1,35 @@
-from collections.abc import Mapping
+import asyncio
+import json
+import os
+import threading
+from collections.abc import AsyncIterator, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
 from typing import Any, Literal
 
 import pytest
 
-from power_events.conditions import Neg, Value
+from power_events.conditions import And, Neg, Value
+from power_events.conditions.compiler import CodeCache, code_cache
 from power_events.event import event_converter
-from power_events.exceptions import MultipleRoutesError, NoRouteFoundError
-from power_events.resolver import EventResolver, EventRoute, EventRouter
+from power_events.exceptions import AmbiguousRoutesError, MultipleRoutesError, NoRouteFoundError
+from power_events.metrics import InMemoryMetrics
+from power_events.resolver import EventResolver, EventRoute, EventRouter, _CompileOnFirstCheck
+
+
+class IsPlainDict(And):
+    def check(self, event: Any) -> bool:
+        return type(event) is dict
+
+
+def current_pid(_event: dict[str, Any]) -> int:
+    return os.getpid()
+
+
+def raise_value_error(_event: dict[str, Any]) -> int:
+    raise ValueError("from process")
 
 
 class TestEventRoute:
@@ -23,6 +45,8 @@ class TestEventRoute:
 
         assert EventRoute(route_test_name, Value("a").equals(1)).name == "route_test_name"
         assert EventRoute(lambda x: x, Value("a").equals(1)).name == "<lambda>"
+        func = partial(route_test_name)
+        assert EventRoute(func, Value("a").equals(1)).name == repr(func)
 
 
 class TestResolver:
@@ -269,6 +293,74 @@ class TestResolver:
             }
         ) == ["12345 has 1 digital purchases"]
 
+    @pytest.mark.parametrize(("shared", "conversions"), [(True, 2), (False, 6)])
+    def test_event_converter_shared_between_routes(self, shared: bool, conversions: int) -> None:
+        app = EventResolver(allow_multiple_routes=True)
+        converted: list[int] = []
+
+        def to_id(event: dict[str, Any]) -> int:
+            converted.append(event["id"])
+            return int(event["id"])
+
+        @app.equal("type", "a")
+        @event_converter(to_id, shared=shared)
+        def handle_blocking(event_id: int) -> int:
+            return event_id
+
+        @app.equal("type", "a", blocking=False)
+        @event_converter(to_id, shared=shared)
+        def handle_inline(event_id: int) -> int:
+            return event_id + 1
+
+        @app.equal("type", "a")
+        @event_converter(to_id, shared=shared)
+        def handle_other(event_id: int) -> int:
+            return event_id + 2
+
+        assert app.resolve({"type": "a", "id": "1"}) == [1, 2, 3]
+        assert app.resolve({"type": "a", "id": "2"}) == [2, 3, 4]
+        assert len(converted) == conversions
+
+    def test_event_converter_shared_should_not_wait_for_other_converters(self) -> None:
+        app = EventResolver(allow_multiple_routes=True)
+        started = threading.Barrier(2, timeout=5)
+
+        def to_id(event: dict[str, Any]) -> int:
+            started.wait()
+            return int(event["id"])
+
+        def to_type(event: dict[str, Any]) -> str:
+            started.wait()
+            return str(event["type"])
+
+        @app.equal("type", "a")
+        @event_converter(to_id, shared=True)
+        def handle_id(event_id: int) -> int:
+            return event_id
+
+        @app.equal("type", "a")
+        @event_converter(to_type, shared=True)
+        def handle_type(event_type: str) -> str:
+            return event_type
+
+        # Each conversion waits for the other one to start.
+        assert app.resolve({"type": "a", "id": "1"}) == [1, "a"]
+
+    def test_event_converter_shared_outside_resolution(self) -> None:
+        converted: list[int] = []
+
+        def to_id(event: dict[str, Any]) -> int:
+            converted.append(event["id"])
+            return int(event["id"])
+
+        @event_converter(to_id, shared=True)
+        def handle(event_id: int) -> int:
+            return event_id
+
+        event = {"id": "1"}
+        assert handle(event) == handle(event) == 1  # type: ignore[arg-type]
+        assert len(converted) == 2
+
     def test_readme_simple(self) -> None:
         app = EventResolver()
 
@@ -317,3 +409,710 @@ class TestResolver:
                 "cart": {"is_digital": False, "items": ["keyboard"]},
             }
         ) == ["The order created is a physical purchase: 12345"]
+
+    def test_resolve_should_keep_registration_order_with_indexed_routes(self) -> None:
+        app = EventResolver(allow_multiple_routes=True)
+
+        @app.when(Value("a").is_truthy())
+        def handle_truthy(_event: dict[str, Any]) -> str:
+            return "truthy"
+
+        @app.equal("type", "create")
+        def handle_create(_event: dict[str, Any]) -> str:
+            return "create"
+
+        @app.one_of("type", ["create", "delete"])
+        def handle_operation(_event: dict[str, Any]) -> str:
+            return "operation"
+
+        assert app.resolve({"type": "create", "a": 1}) == ["truthy", "create", "operation"]
+
+        @app.equal("type", "delete")
+        def handle_delete(_event: dict[str, Any]) -> str:
+            return "delete"
+
+        assert app.resolve({"type": "delete"}) == ["operation", "delete"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_async_should_run_on_running_loop(self) -> None:
+        app = EventResolver(allow_multiple_routes=True)
+
+        @app.equal("a", 1)
+        async def handle_async(_event: dict[str, Any]) -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        @app.equal("a", 1)
+        def handle_sync(_event: dict[str, Any]) -> str:
+            return "sync"
+
+        assert await app.resolve_async({"a": 1}) == [asyncio.get_running_loop(), "sync"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_async_should_handle_errors_like_resolve(self) -> None:
+        app = EventResolver(allow_no_route=False)
+
+        @app.exception_handler(ValueError)
+        def handle_value_error(exception: ValueError) -> str:
+            return f"handled {exception}"
+
+        @app.equal("a", 1)
+        async def handle_a(_event: dict[str, Any]) -> str:
+            raise ValueError("a")
+
+        assert await app.resolve_async({"a": 1}) == ["handled a"]
+        with pytest.raises(NoRouteFoundError):
+            await app.resolve_async({"a": 2})
+
+    def test_resolve_should_reuse_loop_when_set(self) -> None:
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        with EventResolver(reuse_loop=True) as app:
+
+            @app.equal("a", 1)
+            async def handle_a(_event: dict[str, Any]) -> int:
+                loops.append(asyncio.get_running_loop())
+                return 1
+
+            assert app.resolve({"a": 1}) == [1]
+            assert app.resolve({"a": 1}) == [1]
+
+        assert loops[0] is loops[1]
+        assert loops[0].is_closed()
+        assert app.resolve({"a": 1}) == [1]
+        assert loops[2] is not loops[0]
+        app.close()
+        app.close()
+
+    def test_resolve_should_use_loop_factory(self) -> None:
+        created: list[asyncio.AbstractEventLoop] = []
+
+        def loop_factory() -> asyncio.AbstractEventLoop:
+            created.append(asyncio.new_event_loop())
+            return created[-1]
+
+        app = EventResolver(loop_factory=loop_factory)
+
+        @app.equal("a", 1)
+        async def handle_a(_event: dict[str, Any]) -> bool:
+            return asyncio.get_running_loop() is created[-1]
+
+        assert app.resolve({"a": 1}) == [True]
+        assert app.resolve({"a": 1}) == [True]
+        assert len(created) == 2
+
+    def test_resolve_should_run_sync_routes_in_thread_by_default(self) -> None:
+        app = EventResolver()
+
+        @app.equal("a", 1)
+        def handle_a(_event: dict[str, Any]) -> str:
+            return threading.current_thread().name
+
+        assert app.resolve({"a": 1}) != [threading.current_thread().name]
+
+    def test_resolve_should_run_non_blocking_routes_on_loop(self) -> None:
+        app = EventResolver(allow_multiple_routes=True)
+
+        @app.equal("a", 1, blocking=False)
+        def handle_non_blocking(_event: dict[str, Any]) -> str:
+            return threading.current_thread().name
+
+        @app.when(Value("a").equals(1))
+        def handle_blocking(_event: dict[str, Any]) -> str:
+            return threading.current_thread().name
+
+        non_blocking, blocking = app.resolve({"a": 1})
+        assert non_blocking == threading.current_thread().name
+        assert blocking != threading.current_thread().name
+
+    def test_resolve_should_inline_single_route_when_set(self) -> None:
+        app = EventResolver(inline_single_route=True, allow_multiple_routes=True)
+
+        @app.equal("a", 1)
+        def handle_a(_event: dict[str, Any]) -> str:
+            return threading.current_thread().name
+
+        @app.one_of("a", [1, 2], blocking=True)
+        def handle_blocking(_event: dict[str, Any]) -> str:
+            return threading.current_thread().name
+
+        @app.contain("b", 1)
+        def handle_b(_event: dict[str, Any]) -> str:
+            return threading.current_thread().name
+
+        assert app.resolve({"b": [1]}) == [threading.current_thread().name]
+        assert app.resolve({"a": 2}) != [threading.current_thread().name]
+        assert threading.current_thread().name not in app.resolve({"a": 1})
+
+    def test_resolve_should_run_blocking_routes_in_executor(self) -> None:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="routes") as executor:
+            app = EventResolver(executor=executor)
+
+            @app.equal("a", 1)
+            def handle_a(_event: dict[str, Any]) -> str:
+                return threading.current_thread().name
+
+            assert app.resolve({"a": 1})[0].startswith("routes")
+
+    def test_include_router_should_keep_route_blocking(self) -> None:
+        router = EventRouter()
+
+        @router.equal("a", 1, blocking=False)
+        def handle_a(_event: dict[str, Any]) -> str:
+            return threading.current_thread().name
+
+        app = EventResolver()
+        app.include_router(router, Value("b").equals(1))
+
+        assert app.resolve({"a": 1, "b": 1}) == [threading.current_thread().name]
+
+    def test_resolve_should_run_cpu_bound_routes_in_process_executor(self) -> None:
+        with ProcessPoolExecutor(max_workers=1) as process_executor:
+            app = EventResolver(process_executor=process_executor)
+
+            @app.exception_handler(ValueError)
+            def handle_value_error(exception: ValueError) -> str:
+                return f"handled {exception}"
+
+            app.equal("a", 1, cpu_bound=True)(current_pid)
+            app.equal("a", 2, cpu_bound=True)(raise_value_error)
+
+            assert app.resolve({"a": 1}) != [os.getpid()]
+            assert app.resolve({"a": 2}) == ["handled from process"]
+
+    def test_resolve_should_run_cpu_bound_routes_as_blocking_without_process_executor(
+        self,
+    ) -> None:
+        app = EventResolver()
+
+        app.equal("a", 1, cpu_bound=True)(current_pid)
+
+        assert app.resolve({"a": 1}) == [os.getpid()]
+
+    def test_resolve_with_adaptive_ordering(self) -> None:
+        app = EventResolver(adaptive_ordering=True)
+
+        @app.when(Value("a").is_truthy() & Value("b").equals(1))
+        def handle_a_b(_event: dict[str, Any]) -> str:
+            return "a-b"
+
+        @app.equal("a", 2)
+        def handle_a(_event: dict[str, Any]) -> str:
+            return "a"
+
+        assert app.resolve({"a": 1, "b": 1}) == ["a-b"]
+        assert app.resolve({"a": 2}) == ["a"]
+
+    @pytest.mark.parametrize("adaptive_ordering", [False, True])
+    def test_resolve_should_check_custom_conditions_on_original_event(
+        self, adaptive_ordering: bool
+    ) -> None:
+        app = EventResolver(adaptive_ordering=adaptive_ordering)
+
+        @app.when(Value("a").equals(1) & IsPlainDict())
+        def handle_a(_event: dict[str, Any]) -> str:
+            return "a"
+
+        @app.when(Value("a").equals(2) & IsPlainDict())
+        def handle_other_a(_event: dict[str, Any]) -> str:
+            return "other a"
+
+        assert app.resolve({"a": 1}) == ["a"]
+
+    def test_resolve_with_match_cache(self) -> None:
+        app = EventResolver(match_cache_size=2)
+
+        @app.when(Value("type").equals("a") & Value("detail.n").is_truthy())
+        def handle_a(_event: dict[str, Any]) -> str:
+            return "a"
+
+        assert app.resolve({"type": "a", "detail": {"n": 1}, "payload": 1}) == ["a"]
+        assert app.resolve({"type": "a", "detail": {"n": 1}, "payload": 2}) == ["a"]
+        assert app.resolve({"type": "a", "detail": {"n": 0}}) == []
+        assert app.resolve({"type": "a", "detail": {"n": [1]}}) == ["a"]
+        assert len(app._get_route_table().match_cache or ()) == 2
+
+        @app.one_of("type", ["a", "b"])
+        def handle_a_b(_event: dict[str, Any]) -> str:
+            return "a-b"
+
+        assert app.resolve({"type": "b", "detail": {"n": 1}}) == ["a-b"]
+        assert len(app._get_route_table().match_cache or ()) == 1
+
+    def test_resolve_should_not_use_match_cache_when_condition_not_pure(self) -> None:
+        app = EventResolver(match_cache_size=2)
+
+        @app.when(Value("a").match(lambda val: val > 0))
+        def handle_a(_event: dict[str, Any]) -> str:
+            return "a"
+
+        assert app.resolve({"a": 1}) == ["a"]
+        assert app._get_route_table().match_cache is None
+
+    def test_resolve_should_not_use_match_cache_when_options_mutable(self) -> None:
+        app = EventResolver(match_cache_size=2)
+        allowed = {"t1": True}
+
+        @app.when(Value("tenant").one_of(allowed))
+        def handle_tenant(_event: dict[str, Any]) -> str:
+            return "tenant"
+
+        assert app.resolve({"tenant": "t2"}) == []
+        allowed["t2"] = True
+        assert app.resolve({"tenant": "t2"}) == ["tenant"]
+
+    def test_resolve_with_metrics(self) -> None:
+        metrics = InMemoryMetrics()
+        app = EventResolver(metrics=metrics)
+
+        @app.equal("a", 1)
+        def handle_one(_event: dict[str, Any]) -> str:
+            return "one"
+
+        @app.equal("a", 2)
+        def handle_two(_event: dict[str, Any]) -> str:
+            raise ValueError
+
+        @app.fallback
+        def handle_other(_event: dict[str, Any]) -> str:
+            return "other"
+
+        @app.exception_handler(ValueError)
+        def handle_value_error(_exc: ValueError) -> str:
+            return "error"
+
+        assert app.resolve({"a": 1}) == ["one"]
+        assert app.resolve({"a": 2}) == ["error"]
+        assert app.resolve({"a": 3}) == ["other"]
+
+        assert metrics.checks["handle_one"].checks == 1
+        assert metrics.checks["handle_one"].matches == 1
+        assert metrics.executions["handle_one"].count == 1
+        assert metrics.executions["handle_two"].count == 1
+        assert metrics.fallbacks == {"handle_other": 1}
+        assert metrics.exceptions_handled == {("ValueError", "handle_value_error"): 1}
+
+    def test_resolve_with_metrics_when_routes_have_no_name(self) -> None:
+        class Handler:
+            def __call__(self, _event: dict[str, Any]) -> str:
+                return "object"
+
+            def __repr__(self) -> str:
+                return "Handler()"
+
+        metrics = InMemoryMetrics()
+        app = EventResolver(metrics=metrics, allow_multiple_routes=True)
+        app.when(Value("a").equals(1))(partial(lambda _event, result: result, result="partial"))
+        app.when(Value("a").is_truthy())(Handler())
+
+        assert app.resolve({"a": 1}) == ["partial", "object"]
+        assert metrics.executions["Handler()"].count == 1
+        assert sum(stats.count for stats in metrics.executions.values()) == 2
+
+    def test_resolve_raw_json(self) -> None:
+        app = EventResolver()
+
+        @app.equal("detail.type", "order_created")
+        def handle_order(event: Mapping[str, Any]) -> Any:
+            return event["payload"]
+
+        raw = b'{"detail": {"type": "order_created"}, "payload": [1, 2]}'
+        assert app.resolve(raw) == [[1, 2]]
+        assert app.resolve(memoryview(raw)) == [[1, 2]]
+        assert app.resolve(b'{"detail": {"type": "other"}, "payload": invalid') == []
+
+    def test_resolve_raw_json_read_by_routes_in_threads(self) -> None:
+        app = EventResolver(allow_multiple_routes=True)
+        document = {"type": "a", **{f"k{i}": {"v": i} for i in range(300)}}
+
+        for offset in range(4):
+
+            @app.equal("type", "a")
+            def handle(event: Mapping[str, Any], offset: int = offset) -> list[Any]:
+                return [event[f"k{i}"]["v"] for i in range(offset, 300, 4)]
+
+        raw = json.dumps(document).encode()
+        for _ in range(50):
+            assert app.resolve(raw) == [list(range(offset, 300, 4)) for offset in range(4)]
+
+    def test_resolve_raw_json_with_literal_prefilter(self) -> None:
+        app = EventResolver(literal_prefilter=True)
+
+        @app.one_of("type", ["created", "deleted"])
+        def handle(event: Mapping[str, Any]) -> Any:
+            return event["type"]
+
+        @app.fallback
+        def fallback(_event: Mapping[str, Any]) -> str:
+            return "fallback"
+
+        assert app.resolve(b'{"type": "created"}') == ["created"]
+        # rejected without being decoded
+        assert app.resolve(b'{"type": "other", invalid') == ["fallback"]
+        assert app._get_route_table().prefilter is not None
+
+    def test_resolve_raw_json_rejected_by_literal_prefilter_without_view(self) -> None:
+        app = EventResolver(literal_prefilter=True)
+
+        @app.equal("type", "created")
+        def handle(event: Mapping[str, Any]) -> Any:
+            return event["type"]
+
+        assert app.resolve(b"[1, 2]") == []
+        assert app.resolve(b'\xff{"type": "other"}') == []
+
+    def test_resolve_should_handle_invalid_raw_json(self) -> None:
+        app = EventResolver()
+
+        @app.equal("type", "created")
+        def handle(event: Mapping[str, Any]) -> Any:
+            return event["type"]
+
+        @app.exception_handler(ValueError)
+        def handle_value_error(exc: ValueError) -> str:
+            return type(exc).__name__
+
+        assert app.resolve(b"[1, 2]") == ["JSONDecodeError"]
+        assert app.resolve(b'\xff{"type": "created"}') == ["UnicodeDecodeError"]
+
+    def test_resolve_should_not_use_literal_prefilter_when_literals_not_required(self) -> None:
+        app = EventResolver(literal_prefilter=True)
+
+        @app.when(Value("type").is_truthy())
+        def handle(event: Mapping[str, Any]) -> Any:
+            return event["type"]
+
+        assert app.resolve(b'{"type": "created"}') == ["created"]
+        assert app._get_route_table().prefilter is None
+
+    def test_freeze(self) -> None:
+        app = EventResolver()
+
+        @app.equal("type", "a")
+        def handle_a(_event: Mapping[str, Any]) -> str:
+            return "a"
+
+        table = app.freeze()
+        assert app._get_route_table() is table
+        assert not any(isinstance(check, _CompileOnFirstCheck) for check in table.checks)
+
+        @app.equal("type", "b")
+        def handle_b(_event: Mapping[str, Any]) -> str:
+            raise KeyError("b")
+
+        @app.exception_handler(LookupError)
+        def handle_lookup_error(exc: LookupError) -> str:
+            return "handled"
+
+        new_table = app._get_route_table()
+        assert new_table is not table
+        assert [route.name for route in table.routes] == ["handle_a"]
+        assert table.exception_handler(KeyError) is None
+        assert new_table.exception_handler(KeyError) is handle_lookup_error
+        assert app.resolve({"type": "b"}) == ["handled"]
+
+    def test_freeze_with_cache_path(self, tmp_path: Path) -> None:
+        path = tmp_path / "conditions.cache"
+        app = EventResolver()
+
+        @app.when(Value("type").equals("a") & Value("id").is_truthy() & Value("x").is_falsy())
+        def handle_a(_event: Mapping[str, Any]) -> str:
+            return "a"
+
+        app.freeze(path)
+
+        assert path.exists()
+        assert not code_cache.modified
+        assert CodeCache().load(path)
+        assert app.resolve({"type": "a", "id": 1, "x": 0}) == ["a"]
+
+    def test_resolve_while_registering_routes(self) -> None:
+        app = EventResolver(reuse_loop=False)
+        app.freeze()
+        errors: list[BaseException] = []
+
+        def register() -> None:
+            for i in range(50):
+                app.equal("type", i)(lambda _event, i=i: i)
+
+        def resolve() -> None:
+            try:
+                for i in range(50):
+                    assert app.resolve({"type": i}) in ([], [i])
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=register), threading.Thread(target=resolve)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert app.resolve({"type": 49}) == [49]
+
+    def test_resolve_first_match_by_priority(self) -> None:
+        app = EventResolver(first_match=True)
+
+        @app.one_of("type", ["create", "delete"])
+        def handle_operation(_event: dict[str, Any]) -> str:
+            return "operation"
+
+        @app.equal("type", "delete", priority=1)
+        def handle_deletion(_event: dict[str, Any]) -> str:
+            return "deletion"
+
+        @app.when(Value("type").is_truthy())
+        def handle_other(_event: dict[str, Any]) -> str:
+            return "other"
+
+        assert app.resolve({"type": "delete"}) == ["deletion"]
+        assert app.resolve({"type": "create"}) == ["operation"]
+        assert app.resolve({"type": "update"}) == ["other"]
+
+    def test_resolve_first_match_should_stop_at_first_matching_route(self) -> None:
+        checked: list[int] = []
+
+        def check(position: int) -> Value:
+            def predicate(_value: Any) -> bool:
+                checked.append(position)
+                return True
+
+            return Value("a").match(predicate)
+
+        metrics = InMemoryMetrics()
+        app = EventResolver(first_match=True)
+        for i in range(3):
+            app.when(check(i))(lambda _event, i=i: i)
+        with_metrics = EventResolver(first_match=True, metrics=metrics)
+        with_metrics.include_router(app)
+
+        assert app.resolve({"a": 1}) == [0]
+        assert checked == [0]
+        assert with_metrics.resolve({"a": 1}) == [0]
+        assert list(metrics.checks) == ["<lambda>"]
+        assert metrics.checks["<lambda>"].checks == 1
+
+    def test_resolve_first_match_should_raise_ambiguous_routes_when_checked(self) -> None:
+        app = EventResolver(first_match=True, check_ambiguity=True)
+
+        @app.equal("type", "delete", priority=1)
+        def handle_deletion(_event: dict[str, Any]) -> str:
+            return "deletion"
+
+        @app.one_of("type", ["create", "delete"], priority=1)
+        def handle_operation(_event: dict[str, Any]) -> str:
+            return "operation"
+
+        @app.when(Value("type").is_truthy())
+        def handle_other(_event: dict[str, Any]) -> str:
+            return "other"
+
+        assert app.resolve({"type": "create"}) == ["operation"]
+        with pytest.raises(AmbiguousRoutesError) as exc_info:
+            app.resolve({"type": "delete"})
+        assert exc_info.value.ambiguous_routes == ["handle_deletion", "handle_operation"]
+
+    def test_overlapping_routes(self) -> None:
+        app = EventResolver()
+
+        @app.equal("type", "delete")
+        def handle_deletion(_event: dict[str, Any]) -> str:
+            return "deletion"
+
+        @app.one_of("type", ["create", "delete"])
+        def handle_operation(_event: dict[str, Any]) -> str:
+            return "operation"
+
+        @app.equal("type", "update")
+        def handle_update(_event: dict[str, Any]) -> str:
+            return "update"
+
+        assert [(a.name, b.name) for a, b in app.overlapping_routes()] == [
+            ("handle_deletion", "handle_operation")
+        ]
+        with pytest.raises(MultipleRoutesError):
+            app.resolve({"type": "delete"})
+
+    def test_resolve_should_stop_at_first_match_when_routes_exclusive(self) -> None:
+        metrics = InMemoryMetrics()
+        app = EventResolver(metrics=metrics)
+
+        @app.when(Value("p").equals(1) & Value("s").equals(1))
+        def handle_a(_event: dict[str, Any]) -> str:
+            return "a"
+
+        @app.when(Value("q").equals(1) & Value("s").equals(2))
+        def handle_b(_event: dict[str, Any]) -> str:
+            return "b"
+
+        @app.when(Value("p").equals(2) & Value("q").equals(2))
+        def handle_c(_event: dict[str, Any]) -> str:
+            return "c"
+
+        assert app.overlapping_routes() == []
+        assert app.freeze().first_match
+        # Both handle_a and handle_b are candidates, only the first is checked.
+        assert app.resolve({"p": 1, "q": 1, "s": 1}) == ["a"]
+        assert list(metrics.checks) == ["handle_a"]
+
+    def test_resolver_should_raise_error_when_first_match_with_multiple_routes(self) -> None:
+        with pytest.raises(ValueError, match="First match mode"):
+            EventResolver(first_match=True, allow_multiple_routes=True)
+
+
+class TestResolveStream:
+    @staticmethod
+    def sleeping_resolver() -> tuple[EventResolver, list[int]]:
+        """Resolver sleeping the delay of the events, recording the maximum number in flight."""
+        app = EventResolver()
+        in_flight = [0, 0]  # current, maximum
+
+        @app.when(Value("delay").match(lambda delay: delay >= 0))
+        async def handle(event: dict[str, Any]) -> float:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            await asyncio.sleep(event["delay"])
+            in_flight[0] -= 1
+            return float(event["delay"])
+
+        return app, in_flight
+
+    @pytest.mark.asyncio
+    async def test_should_yield_results_in_order(self) -> None:
+        app, in_flight = self.sleeping_resolver()
+        events = [{"delay": delay} for delay in (0.03, 0.01, 0.02, 0.0)]
+
+        results = [r async for r in app.resolve_stream_async(events, concurrency=2)]
+
+        assert results == [[0.03], [0.01], [0.02], [0.0]]
+        assert in_flight[1] == 2
+
+    @pytest.mark.asyncio
+    async def test_should_yield_results_as_completed(self) -> None:
+        app, in_flight = self.sleeping_resolver()
+
+        async def events() -> AsyncIterator[dict[str, Any]]:
+            for delay in (0.05, 0.01, 0.02):
+                yield {"delay": delay}
+
+        results = [r async for r in app.resolve_stream_async(events(), ordered=False)]
+
+        assert results == [[0.01], [0.02], [0.05]]
+        assert in_flight[1] == 3
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    @pytest.mark.asyncio
+    async def test_should_yield_results_while_source_idle(self, ordered: bool) -> None:
+        app, _ = self.sleeping_resolver()
+        idle = asyncio.Event()
+
+        async def events() -> AsyncIterator[dict[str, Any]]:
+            yield {"delay": 0}
+            await idle.wait()
+            yield {"delay": 0.01}
+
+        stream = app.resolve_stream_async(events(), ordered=ordered)
+        assert await asyncio.wait_for(stream.__anext__(), timeout=1) == [0.0]
+        idle.set()
+
+        assert [r async for r in stream] == [[0.01]]
+
+    @pytest.mark.asyncio
+    async def test_should_raise_unhandled_error_while_source_idle(self) -> None:
+        app = EventResolver()
+
+        @app.equal("a", 1)
+        async def handle_error(_event: dict[str, Any]) -> None:
+            raise ValueError
+
+        async def events() -> AsyncIterator[dict[str, Any]]:
+            yield {"a": 1}
+            await asyncio.Event().wait()
+            yield {"a": 2}  # pragma: no cover
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            await asyncio.wait_for(app.resolve_stream_async(events()).__anext__(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_should_pull_events_only_when_below_concurrency(self) -> None:
+        app, _ = self.sleeping_resolver()
+        pulled = []
+
+        def events() -> Iterator[dict[str, Any]]:
+            for i in range(10):
+                pulled.append(i)
+                yield {"delay": 0}
+
+        stream = app.resolve_stream_async(events(), concurrency=3)
+        assert await stream.__anext__() == [0.0]
+        assert pulled == [0, 1, 2]
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_should_handle_errors_per_event(self) -> None:
+        app = EventResolver()
+
+        @app.equal("a", 1)
+        def handle(_event: dict[str, Any]) -> str:
+            raise ValueError("one")
+
+        @app.equal("a", 2)
+        def handle_two(_event: dict[str, Any]) -> str:
+            return "two"
+
+        @app.exception_handler(ValueError)
+        def handle_value_error(exc: ValueError) -> str:
+            return f"error {exc}"
+
+        results = [r async for r in app.resolve_stream_async([{"a": 1}, {"a": 2}])]
+
+        assert results == [["error one"], ["two"]]
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_in_flight_events_when_unhandled_error(self) -> None:
+        app = EventResolver()
+        cancelled = asyncio.Event()
+
+        @app.equal("a", 1)
+        async def handle_slow(_event: dict[str, Any]) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        @app.equal("a", 2)
+        async def handle_error(_event: dict[str, Any]) -> None:
+            raise ValueError
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            _ = [r async for r in app.resolve_stream_async([{"a": 1}, {"a": 2}], ordered=False)]
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_should_raise_error_when_concurrency_not_positive(self) -> None:
+        app = EventResolver()
+
+        with pytest.raises(ValueError, match="positive"):
+            await app.resolve_stream_async([], concurrency=0).__anext__()
+
+    @pytest.mark.parametrize("reuse_loop", [True, False])
+    def test_resolve_stream(self, reuse_loop: bool) -> None:
+        app, in_flight = self.sleeping_resolver()
+        app._reuse_loop = reuse_loop
+        events = [{"delay": 0.01}] * 4
+
+        with app:
+            assert list(app.resolve_stream(events)) == [[0.01]] * 4
+        assert in_flight[1] == 4
+
+    def test_resolve_stream_should_stop_resolving_when_closed(self) -> None:
+        app, _ = self.sleeping_resolver()
+        events = ({"delay": 0} for _ in range(10))
+
+        stream = app.resolve_stream(events, concurrency=2)
+        assert next(stream) == [0.0]
+        stream.close()
+
+        assert len(list(events)) == 8
@@ -0,0 +1,133 @@
+import re
+from typing import Any
+
+from power_events.conditions import Value
+from power_events.route_index import RouteIndex
+
+
+class OptionalValue(Value):
+    def check(self, event: Any, *, raise_if_absent: bool = False) -> bool:
+        return "a" not in event or super().check(event, raise_if_absent=raise_if_absent)
+
+
+class TestRouteIndex:
+    def test_candidates_should_only_return_conditions_expecting_the_value(self) -> None:
+        index = RouteIndex(
+            [
+                Value("type").equals("a"),
+                Value("type").one_of(["b", "c"]),
+                Value("type").equals("c"),
+            ]
+        )
+
+        assert index.candidates({"type": "a"}) == [0]
+        assert index.candidates({"type": "c"}) == [1, 2]
+        assert index.candidates({"type": "d"}) == []
+        assert index.candidates({}) == []
+
+    def test_candidates_should_always_return_unindexed_conditions_in_order(self) -> None:
+        index = RouteIndex(
+            [
+                Value("type").is_truthy(),
+                Value("type").equals("a"),
+                Value("type", str.upper).equals("A"),
+                ~Value("type").equals("a"),
+            ]
+        )
+
+        assert index.candidates({"type": "a"}) == [0, 1, 2, 3]
+        assert index.candidates({"type": "b"}) == [0, 2, 3]
+
+    def test_should_index_nested_and_conditions(self) -> None:
+        index = RouteIndex(
+            [
+                Value("source").equals("s") & (Value("type").equals("a") & Value("x").is_truthy()),
+                Value("type").equals("b") & Value("type").one_of(["b", "c"]),
+                Value("type").equals("a") | Value("x").is_truthy(),
+            ]
+        )
+
+        assert index.indexed_paths == ["type"]
+        assert index.candidates({"type": "a"}) == [0, 2]
+        assert index.candidates({"type": "c"}) == [2]
+
+    def test_should_index_or_conditions_on_paths_bound_by_all_branches(self) -> None:
+        index = RouteIndex(
+            [
+                Value("type").equals("a") | (Value("type").equals("b") & Value("x").is_truthy()),
+                Value("type").one_of(["b", "c"]),
+            ]
+        )
+
+        assert index.indexed_paths == ["type"]
+        assert index.candidates({"type": "b"}) == [0, 1]
+        assert index.candidates({"type": "c"}) == [1]
+        assert index.candidates({"type": "d"}) == []
+
+    def test_candidates_should_return_all_path_conditions_when_value_unhashable(self) -> None:
+        index = RouteIndex([Value("type").equals("a"), Value("type").one_of(["a", "b"])])
+
+        assert index.candidates({"type": ["a"]}) == [0, 1]
+
+    def test_candidates_should_only_return_conditions_matching_regex(self) -> None:
+        index = RouteIndex(
+            [
+                Value("name").match_regex(r"^Create\w+$"),
+                Value("name").match_regex("delete", re.IGNORECASE) & Value("x").is_truthy(),
+                Value("name").match_regex("Put(Object|Bucket)") | Value("name").match_regex("Get"),
+                Value("name").match_regex(re.compile("(?x) Get  # comment")),
+                Value("name").match_regex("^a$", re.MULTILINE),
+            ]
+        )
+
+        assert index.indexed_paths == ["name"]
+        assert index.candidates({"name": "CreateUser"}) == [0]
+        assert index.candidates({"name": "DELETE"}) == [1]
+        assert index.candidates({"name": "PutBucket"}) == [2]
+        assert index.candidates({"name": "GetObject"}) == [2, 3]
+        assert index.candidates({"name": "a\nb"}) == [4]
+        assert index.candidates({"name": "Other"}) == []
+        assert index.candidates({}) == []
+        assert index.candidates({"name": 1}) == [0, 1, 2, 3, 4]
+
+    def test_should_not_combine_regex_with_group_references(self) -> None:
+        index = RouteIndex(
+            [
+                Value("name").match_regex(r"(a)\1"),
+                Value("name").match_regex(r"(?P<first>a)"),
+                Value("name").match_regex("b"),
+            ]
+        )
+
+        assert index.candidates({"name": "b"}) == [0, 1, 2]
+        assert index.candidates({"name": "c"}) == [0, 1]
+
+    def test_overlapping_should_skip_conditions_bound_to_disjoint_values(self) -> None:
+        index = RouteIndex(
+            [
+                Value("type").equals("a"),
+                Value("type").one_of(["b", "c"]) & Value("source").equals("s"),
+                Value("type").equals("c") & Value("source").equals("t"),
+                Value("type").one_of(["a", "c"]),
+                Value("x").is_truthy(),
+            ]
+        )
+
+        assert list(index.overlapping()) == [(0, 3), (0, 4), (1, 3), (1, 4), (2, 3), (2, 4), (3, 4)]
+
+    def test_overlapping_should_be_empty_when_conditions_exclusive(self) -> None:
+        index = RouteIndex([Value("type").equals(i) for i in range(100)])
+
+        assert list(index.overlapping()) == []
+
+    def test_should_not_index_value_subclasses(self) -> None:
+        index = RouteIndex(
+            [
+                Value("a").equals(1),
+                OptionalValue("a").equals(2),
+                OptionalValue("b").match_regex("x") & Value("c").is_truthy(),
+            ]
+        )
+
+        assert index.candidates({"a": 1}) == [0, 1, 2]
+        assert index.candidates({"b": "y"}) == [1, 2]
@@ -0,0 +1,167 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from power_events import EventResolver
+from power_events.exceptions import RuleSetError
+from power_events.rules import load_rules, load_rules_file
+
+
+def handle_order(event: Any) -> str:
+    return "order"
+
+
+def handle_user(event: Any) -> str:
+    return "user"
+
+
+HANDLERS = {"handle_order": handle_order, "handle_user": handle_user}
+
+RULES: dict[str, Any] = {
+    "routes": [
+        {
+            "handler": "handle_order",
+            "when": {
+                "all": [
+                    {"path": "type", "op": "one_of", "value": ["created", "updated"]},
+                    {"not": {"path": "detail.test", "op": "is_truthy"}},
+                ]
+            },
+            "blocking": False,
+        },
+        {
+            "handler": "handle_user",
+            "when": {
+                "any": [
+                    {"path": "user.id", "op": "match_regex", "value": r"u\d+"},
+                    {"path": "tags", "op": "contains", "value": ["user"]},
+                ]
+            },
+        },
+    ]
+}
+
+
+class TestLoadRules:
+    def test_load_rules(self) -> None:
+        app = EventResolver()
+
+        load_rules(app, RULES, HANDLERS)
+
+        assert [route.name for route in app._routes] == ["handle_order", "handle_user"]
+        assert app._routes[0].blocking is False
+        assert app.resolve({"type": "created", "detail": {"test": False}}) == ["order"]
+        assert app.resolve({"type": "created", "detail": {"test": True}}) == []
+        assert app.resolve({"user": {"id": "u12"}}) == ["user"]
+        assert app.resolve({"tags": ["user", "admin"]}) == ["user"]
+
+    def test_load_rules_with_priority(self) -> None:
+        app = EventResolver(first_match=True)
+        when = {"path": "type", "op": "is_truthy"}
+        rules = {
+            "routes": [
+                {"handler": "handle_order", "when": when},
+                {"handler": "handle_user", "when": when, "priority": 1},
+            ]
+        }
+
+        load_rules(app, rules, HANDLERS)
+
+        assert app.resolve({"type": "created"}) == ["user"]
+
+    @pytest.mark.parametrize(
+        ("when", "error"),
+        [
+            ({"path": "type", "op": "eq", "value": 1}, "routes[0].when.op: unknown operator 'eq'"),
+            ({"path": "type", "op": "equals"}, "operator 'equals' requires a value"),
+            ({"path": "type", "op": "is_truthy", "value": 1}, "'is_truthy' takes no value"),
+            ({"path": "type", "op": "one_of", "value": "ab"}, "requires a non-empty list"),
+            ({"path": "type", "op": "match_regex", "value": "("}, "has an invalid regex"),
+            ({"path": "type", "op": "is_length", "value": -1}, "non-negative integer"),
+            ({"path": ".type", "op": "is_truthy"}, "routes[0].when.path: Path value"),
+            ({"path": 1, "op": "is_truthy"}, "routes[0].when.path: requires a string"),
+            ({"path": "type", "op": "is_truthy", "other": 1}, "unknown keys ['other']"),
+            ({"xor": []}, "routes[0].when: unknown combination 'xor'"),
+            ({"all": {}}, "routes[0].when.all: requires a list of conditions"),
+            ({"not": {"any": [1]}}, "routes[0].when.not.any[0]: requires a table"),
+            ({}, "requires either 'path', 'all', 'any' or 'not'"),
+        ],
+    )
+    def test_load_rules_should_raise_error_when_condition_invalid(
+        self, when: Any, error: str
+    ) -> None:
+        app = EventResolver()
+        rules = {"routes": [{"handler": "handle_order", "when": when}, RULES["routes"][1]]}
+
+        with pytest.raises(RuleSetError, match=error.replace("[", r"\[").replace("(", r"\(")):
+            load_rules(app, rules, HANDLERS)
+        assert app._routes == []
+
+    def test_load_rules_should_report_all_errors(self) -> None:
+        rules = {
+            "routes": [
+                {
+                    "handler": "unknown",
+                    "when": {"path": "a", "op": "is_truthy"},
+                    "cpu_bound": 1,
+                    "priority": True,
+                },
+                {"handler": "handle_user", "when": None, "blocking": "no", "other": 1},
+                "route",
+            ]
+        }
+
+        with pytest.raises(RuleSetError) as exc_info:
+            load_rules(EventResolver(), rules, HANDLERS)
+
+        assert exc_info.value.errors == [
+            "routes[0].handler: unknown handler 'unknown'",
+            "routes[0].cpu_bound: requires a boolean",
+            "routes[0].priority: requires an integer",
+            "routes[1]: unknown keys ['other']",
+            "routes[1].blocking: requires a boolean",
+            "routes[1].when: requires a table of the condition",
+            "routes[2]: requires a table of the route",
+        ]
+
+    @pytest.mark.parametrize("rules", [{}, [], {"routes": {}}])
+    def test_load_rules_should_raise_error_when_no_routes(self, rules: Any) -> None:
+        with pytest.raises(RuleSetError, match="requires a list of routes"):
+            load_rules(EventResolver(), rules, HANDLERS)
+
+
+class TestLoadRulesFile:
+    def test_load_json_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps(RULES))
+        app = EventResolver()
+
+        load_rules_file(app, path, HANDLERS)
+
+        assert app.resolve({"type": "updated", "detail": {}}) == []
+        assert app.resolve({"type": "updated", "detail": {"test": 0}}) == ["order"]
+
+    def test_load_toml_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "rules.toml"
+        path.write_text(
+            "[[routes]]\n"
+            'handler = "handle_user"\n'
+            'when = { path = "user.id", op = "match_regex", value = "u\\\\d+" }\n'
+        )
+        app = EventResolver()
+
+        load_rules_file(app, str(path), HANDLERS)
+
+        assert app.resolve({"user": {"id": "u1"}}) == ["user"]
+
+    @pytest.mark.parametrize("name", ["rules.json", "rules.toml"])
+    def test_load_file_should_raise_error_when_not_parsable(
+        self, tmp_path: Path, name: str
+    ) -> None:
+        path = tmp_path / name
+        path.write_text("routes = [")
+
+        with pytest.raises(RuleSetError, match=name):
+            load_rules_file(EventResolver(), path, HANDLERS)
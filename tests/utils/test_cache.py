@@ -0,0 +1,29 @@
+import pytest
+
+from power_events.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    def test_should_evict_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_clear(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.clear()
+
+        assert cache.get("a") is None
+
+    def test_should_raise_error_when_size_not_positive(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            LRUCache(0)
@@ -0,0 +1,33 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+import pytest
+
+from power_events.utils.functions import run_async, run_in_executor
+
+request_id: ContextVar[str] = ContextVar("request_id")
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_run_async() -> None:
+    async def double(val: int) -> int:
+        return val * 2
+
+    assert await run_async(double, 2) == 4  # type: ignore[arg-type]
+    assert await run_async(current_thread_name) != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_run_in_executor_should_use_executor_and_keep_context() -> None:
+    request_id.set("42")
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom") as executor:
+        assert (await run_in_executor(executor, current_thread_name)).startswith("custom")
+        assert await run_in_executor(executor, request_id.get) == "42"
+
+    assert await run_in_executor(None, request_id.get) == "42"